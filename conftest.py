@@ -0,0 +1,11 @@
+"""Repository-level pytest configuration."""
+
+import os
+import sys
+
+# Prefer the installed package (pip install -e .); fall back to the source
+# tree so the tests still run from a plain checkout
+try:
+    import data_anonymizer  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -271,7 +271,7 @@ def main():
             - **None**: No anonymization applied
             - **Hash**: Replace values with one-way cryptographic hash (SHA-256)
             - **Mask**: Replace characters with asterisks (e.g., John → J**n)
-            - **Pseudonymize**: Replace with consistent pseudonyms (e.g., John → ID_a1b2c3d4)
+            - **Pseudonymize**: Replace with consistent pseudonyms (e.g., John → ID_a1b2c3d4e5f60718)
             - **Substitute**: Replace with random values from predefined lists
             - **Shuffle**: Randomly shuffle values within the column
             - **Perturb**: Add random noise to numerical values
@@ -39,6 +39,9 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.7.0",
         ],
+        "fast-io": [
+            "python-calamine>=0.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -98,9 +98,14 @@ async def anonymize_data(
                 status_code=404, detail=f"File not found: {filename}"
             )
 
-        # Generate output filename
+        # Generate output filename; Parquet input is written back as CSV,
+        # since save_data has no Parquet writer
         ext = input_path.suffix.lower()
-        output_filename = f"anonymized_{input_path.name}"
+        output_name = input_path.name
+        if ext == ".parquet":
+            ext = ".csv"
+            output_name = input_path.with_suffix(ext).name
+        output_filename = f"anonymized_{output_name}"
         output_path = Path("uploads") / output_filename
 
         # Add background task for anonymization
@@ -1,6 +1,8 @@
 """Core anonymization functionality."""
 
+import copy
 import hashlib
+import importlib.util
 import json
 import os
 import random
@@ -9,13 +11,112 @@ import secrets
 import string
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import xxhash
 from email_validator import EmailNotValidError, validate_email
+from pyarrow import compute as pc
+from pyarrow import csv as pa_csv
 
 from .config import Config
 
+# Prefer the Rust-based calamine reader for Excel files when it is installed
+EXCEL_READ_ENGINE = (
+    "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+)
+
+# Untouched columns may only share memory with the input under Copy-on-Write
+# (always enabled from pandas 3); otherwise writes to the result would leak back
+PANDAS_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+# Common mail providers whose domains anonymize_email leaves untouched
+COMMON_EMAIL_DOMAINS = frozenset({"gmail.com", "yahoo.com", "outlook.com"})
+
+# Patterns used by the per-value anonymizers, compiled once at import
+NON_DIGIT_RE = re.compile(r"\D")
+SSN_DASHED_RE = re.compile(r"\d{3}-\d{2}-\d{4}")
+SSN_DIGITS_RE = re.compile(r"\d{9}")
+
+# Compiled anonymize_dataframe kernels kept per anonymizer (least recently used
+# are evicted first), so a long-lived instance does not grow without bound
+KERNEL_CACHE_SIZE = 128
+
+# Methods whose output depends on more than the value itself (counts or
+# randomness), so categorical columns cannot be transformed per category
+ROW_DEPENDENT_METHODS = frozenset(
+    {"k_anonymity", "differential_privacy", "shuffle", "substitute", "perturb"}
+)
+
+# Cells that pd.read_csv reads as missing by default, so the Arrow CSV parser
+# produces the same nulls
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def _config_cache_key(value: Any) -> Any:
+    """Build a hashable, type-preserving cache key for a masking configuration.
+
+    Unlike JSON, this keeps 1, "1", True and None apart (column labels
+    included). Raises TypeError for values other than plain containers and
+    JSON-like scalars, whose repr may not identify them.
+    """
+    if isinstance(value, dict):
+        items = [(_config_cache_key(k), _config_cache_key(v)) for k, v in value.items()]
+        return ("dict", tuple(sorted(items, key=repr)))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_config_cache_key(v) for v in value))
+    if value is None or type(value) in (str, int, float, bool):
+        return (type(value).__name__, repr(value))
+    raise TypeError(f"Uncacheable configuration value: {type(value).__name__}")
+
+
+class _OsRandom:
+    """Batched random draws backed by the OS CSPRNG (os.urandom).
+
+    Column methods need whole arrays of draws at once, which SystemRandom
+    only yields one value at a time; NumPy's own generators are fast but
+    not cryptographically secure, so their output could reveal the noise.
+    """
+
+    @staticmethod
+    def _bits(count: int) -> np.ndarray:
+        """Draw count random 64-bit words."""
+        return np.frombuffer(os.urandom(8 * count), dtype=np.uint64)
+
+    def random(self, size: int) -> np.ndarray:
+        """Uniform floats in [0, 1), each built from 53 random bits."""
+        return (self._bits(size) >> 11) * 2.0**-53
+
+    def uniform(self, low: float, high: float, size: int) -> np.ndarray:
+        """Uniform floats in [low, high)."""
+        return low + (high - low) * self.random(size)
+
+    def standard_normal(self, size: int) -> np.ndarray:
+        """Standard normal floats via the Box-Muller transform."""
+        pairs = (size + 1) // 2
+        # 1 - u lies in (0, 1], which keeps the logarithm finite
+        radius = np.sqrt(-2.0 * np.log(1.0 - self.random(pairs)))
+        angle = 2.0 * np.pi * self.random(pairs)
+        return np.concatenate((radius * np.cos(angle), radius * np.sin(angle)))[:size]
+
+    def choice(self, options: np.ndarray, size: int) -> np.ndarray:
+        """Pick size elements of options uniformly, with replacement."""
+        # Scaling 53-bit uniforms biases each pick by under len(options) / 2**53
+        return options[(self.random(size) * len(options)).astype(np.intp)]
+
+    def permuted_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Shuffle each row of a 2-D array independently."""
+        # Sorting by random 64-bit keys gives a uniform permutation (ties are
+        # vanishingly rare at these sizes)
+        keys = self._bits(rows.size).reshape(rows.shape)
+        return np.take_along_axis(rows, keys.argsort(axis=1), axis=1)
+
 
 class DataAnonymizer:
     """Data anonymization with multiple techniques."""
@@ -24,8 +125,12 @@ class DataAnonymizer:
         """Initialize the anonymizer with optional salt."""
         self.salt = salt or "default_salt"
         self.config = Config()
-        # Use cryptographically secure random for all operations
+        # Use cryptographically secure random for all operations: SystemRandom
+        # for single values, batched os.urandom draws for whole columns
         self.secure_random = secrets.SystemRandom()
+        self._secure_batch = _OsRandom()
+        # Compiled anonymize_dataframe kernels keyed by masking configuration
+        self._kernel_cache: Dict[Any, Callable[[pd.DataFrame], pd.DataFrame]] = {}
 
         # Common substitution lists for different data types
         self.substitution_lists = {
@@ -83,6 +188,10 @@ class DataAnonymizer:
                 "Country E",
             ],
         }
+        self._substitution_arrays = {
+            data_type: np.array(values, dtype=object)
+            for data_type, values in self.substitution_lists.items()
+        }
 
     def _generate_secure_hash(self, value: Any, algorithm: str = "sha256") -> str:
         """Generate secure hash with salt using specified algorithm."""
@@ -104,6 +213,29 @@ class DataAnonymizer:
         """Hash a value with salt using specified algorithm."""
         return self._generate_secure_hash(value, algorithm)
 
+    def hash_values(self, values: Any, algorithm: str = "sha256") -> List[str]:
+        """Hash a batch of values like hash_value, resolving the algorithm once."""
+        if algorithm not in ("sha256", "sha512", "md5"):
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+        constructor = getattr(hashlib, algorithm)
+        salt = self.salt
+        return [constructor(f"{value}{salt}".encode()).hexdigest() for value in values]
+
+    def hash_series(self, series: pd.Series, algorithm: str = "sha256") -> pd.Series:
+        """Hash a column like hash_value, hashing each distinct value only once."""
+        series = series.astype(str)
+        codes, uniques = pd.factorize(series)
+        hashes = np.array(self.hash_values(uniques, algorithm), dtype=object)
+
+        missing = codes == -1
+        result = np.empty(len(codes), dtype=object)
+        result[~missing] = hashes.take(codes[~missing])
+        if missing.any():
+            result[missing] = self.hash_values(series[missing], algorithm)
+
+        return pd.Series(result, index=series.index, name=series.name)
+
     def mask_value(
         self, value: Any, mask_char: str = "*", preserve_length: bool = True
     ) -> str:
@@ -119,10 +251,53 @@ class DataAnonymizer:
 
     def pseudonymize_value(self, value: Any, prefix: str = "ID") -> str:
         """Replace value with a pseudonym (deterministic replacement)."""
-        # Generate deterministic pseudonym based on hash
-        hash_val = self._generate_secure_hash(value, "sha256")
-        # Use first 8 characters of hash to create pseudonym
-        return f"{prefix}_{hash_val[:8]}"
+        # Pseudonyms only need a stable, well-spread mapping, so use the much
+        # faster non-cryptographic XXH3 instead of SHA-256 (see hash_value)
+        digest = xxhash.xxh3_64_intdigest(f"{self.salt}{value}".encode())
+        return f"{prefix}_{digest:016x}"
+
+    @staticmethod
+    def _factorize_exact(series: pd.Series) -> "tuple[np.ndarray, np.ndarray]":
+        """pd.factorize without merging values that only compare equal.
+
+        pd.factorize treats 1, 1.0 and True (or 0.0 and -0.0) as one value,
+        but the scalar anonymizers format them differently. Mixed object
+        columns are keyed on type and repr, and float columns on their bits.
+        """
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series) in ("string", "empty"):
+                return pd.factorize(series)
+            values = series.to_numpy()
+            keys = np.array(
+                [f"{type(value).__qualname__}:{value!r}" for value in values],
+                dtype=object,
+            )
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind == "f":
+            values = series.to_numpy()
+            keys = values.view(f"i{values.itemsize}")
+        else:
+            return pd.factorize(series)
+
+        codes, _ = pd.factorize(keys)
+        _, first = np.unique(codes, return_index=True)
+        return codes, values[first]
+
+    def _pseudonymize_column(self, series: pd.Series, prefix: str = "ID") -> pd.Series:
+        """Pseudonymize a column, hashing each distinct value only once."""
+        codes, uniques = self._factorize_exact(series)
+        pseudonyms = np.array(
+            [self.pseudonymize_value(value, prefix) for value in uniques], dtype=object
+        )
+        result = pseudonyms.take(codes)
+
+        # Missing values keep their own pseudonyms (None and NaN hash differently)
+        missing = codes == -1
+        if missing.any():
+            result[missing] = [
+                self.pseudonymize_value(value, prefix) for value in series[missing]
+            ]
+
+        return pd.Series(result, index=series.index, name=series.name)
 
     def generalize_numeric(self, value: Any, bin_size: int = 10) -> str:
         """Generalize numeric values into ranges."""
@@ -135,6 +310,30 @@ class DataAnonymizer:
         bin_end = bin_start + bin_size - 1
         return f"{bin_start}-{bin_end}"
 
+    def generalize_numeric_series(
+        self, series: pd.Series, bin_size: int = 10
+    ) -> pd.Series:
+        """Generalize a numeric column into ranges with array arithmetic."""
+        if series.dtype.kind not in "iuf" or series.hasnans:
+            return series.apply(lambda x: self.generalize_numeric(x, bin_size))
+
+        values = series.to_numpy()
+        if series.dtype.kind == "f":
+            if not np.isfinite(values).all():
+                return series.apply(lambda x: self.generalize_numeric(x, bin_size))
+            # Truncate toward zero like int() in the scalar version
+            values = np.trunc(values).astype(np.int64)
+        else:
+            # Narrow integer columns would overflow on bins wider than their range
+            values = values.astype(np.int64, copy=False)
+
+        # Few distinct bins, so format each range label only once
+        codes, starts = pd.factorize((values // bin_size) * bin_size)
+        labels = np.array(
+            [f"{start}-{start + bin_size - 1}" for start in starts], dtype=object
+        )
+        return pd.Series(labels.take(codes), index=series.index, name=series.name)
+
     def generalize_date(self, value: Any, granularity: str = "month") -> str:
         """Generalize dates to reduce precision."""
         if isinstance(value, str):
@@ -166,6 +365,43 @@ class DataAnonymizer:
         else:
             return str(value)
 
+    def generalize_date_series(
+        self, series: pd.Series, granularity: str = "month"
+    ) -> pd.Series:
+        """Generalize a date column with vectorized datetime parsing."""
+        if granularity not in ("year", "month", "quarter"):
+            return series.apply(lambda x: self.generalize_date(x, granularity))
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            dates = series
+        elif pd.api.types.is_string_dtype(series):
+            # Parse the common ISO format in one pass; anything else is left
+            # as NaT and handled by the scalar parser below
+            dates = pd.to_datetime(
+                series, format="%Y-%m-%d", errors="coerce", cache=True
+            )
+        else:
+            return series.apply(lambda x: self.generalize_date(x, granularity))
+
+        parsed = dates.notna().to_numpy()
+        valid = dates[parsed]
+        years = valid.dt.year.astype(str)
+
+        if granularity == "year":
+            generalized = years
+        elif granularity == "month":
+            generalized = years + "-" + valid.dt.month.astype(str).str.zfill(2)
+        else:
+            generalized = years + "-Q" + valid.dt.quarter.astype(str)
+
+        result = np.empty(len(series), dtype=object)
+        result[parsed] = generalized.to_numpy(dtype=object)
+        result[~parsed] = [
+            self.generalize_date(value, granularity) for value in series[~parsed]
+        ]
+
+        return pd.Series(result, index=series.index, name=series.name)
+
     def anonymize_email(self, email: str) -> str:
         """Anonymize email addresses while preserving domain structure."""
         if not isinstance(email, str) or "@" not in email:
@@ -180,11 +416,7 @@ class DataAnonymizer:
             anon_local = f"user{hash_local[:8]}"
 
             # Optionally anonymize domain
-            if domain not in [
-                "gmail.com",
-                "yahoo.com",
-                "outlook.com",
-            ]:  # Keep common domains
+            if domain not in COMMON_EMAIL_DOMAINS:  # Keep common domains
                 domain_parts = domain.split(".")
                 if len(domain_parts) >= 2:
                     # Keep TLD, anonymize the rest
@@ -203,7 +435,7 @@ class DataAnonymizer:
             return str(phone)
 
         # Extract digits only
-        digits = re.sub(r"\D", "", phone)
+        digits = NON_DIGIT_RE.sub("", phone)
 
         if len(digits) >= 7:
             # Generate consistent fake phone number
@@ -216,17 +448,87 @@ class DataAnonymizer:
             )[: len(digits)]
 
             # Preserve original format
-            result = phone
-            digit_index = 0
-            for i, char in enumerate(phone):
-                if char.isdigit() and digit_index < len(fake_digits):
-                    result = result[:i] + fake_digits[digit_index] + result[i + 1 :]
-                    digit_index += 1
-
-            return result
+            return self._replace_digits(phone, fake_digits)
         else:
             return phone
 
+    @staticmethod
+    def _replace_digits(phone: str, fake_digits: str) -> str:
+        """Substitute the digits of a phone number in order, keeping its format."""
+        digits = iter(fake_digits)
+        return "".join(next(digits, char) if char.isdigit() else char for char in phone)
+
+    @staticmethod
+    def _split_strings(series: pd.Series) -> "tuple[np.ndarray, np.ndarray, pd.Series]":
+        """Return str() of every value, a mask of string values, and those strings.
+
+        Pandas string columns (Arrow-backed when pyarrow is available) stay in
+        their string dtype so the .str kernels run on them directly.
+        """
+        if isinstance(series.dtype, pd.StringDtype):
+            is_str = series.notna().to_numpy()
+            rendered = series.to_numpy(
+                dtype=object, na_value=str(series.dtype.na_value), copy=True
+            )
+            return rendered, is_str, series[is_str].reset_index(drop=True)
+
+        values = series.to_numpy(dtype=object)
+        is_str = np.array([isinstance(value, str) for value in values], dtype=bool)
+        rendered = np.array([str(value) for value in values], dtype=object)
+        return rendered, is_str, pd.Series(values[is_str], dtype=object)
+
+    def anonymize_email_series(self, series: pd.Series) -> pd.Series:
+        """Anonymize an email column using column-wide string operations."""
+        result, is_str, text = self._split_strings(series)
+        has_at = text.str.contains("@", regex=False).to_numpy(dtype=bool)
+
+        if has_at.any():
+            parts = text[has_at].str.split("@", n=1, expand=True)
+            local, domain = parts[0], parts[1]
+            anon_local = "user" + self.hash_series(local).str[:8]
+
+            # Keep common and dotless domains, otherwise keep only the TLD
+            keep = domain.isin(COMMON_EMAIL_DOMAINS) | ~domain.str.contains(
+                ".", regex=False
+            )
+            tld = domain.str.rsplit(".", n=1).str[-1]
+            anon_domain = "company" + self.hash_series(domain).str[:6] + "." + tld
+            domain = domain.where(keep, anon_domain)
+
+            is_email = is_str.copy()
+            is_email[is_str] = has_at
+            result[is_email] = (anon_local + "@" + domain).to_numpy(dtype=object)
+
+        return pd.Series(result, index=series.index, name=series.name)
+
+    def anonymize_phone_series(self, series: pd.Series) -> pd.Series:
+        """Anonymize a phone column, hashing and counting digits column-wide."""
+        result, is_phone, text = self._split_strings(series)
+        if not is_phone.any():
+            return pd.Series(result, index=series.index, name=series.name)
+
+        phones = text.to_numpy(dtype=object, copy=True)
+        counts = text.str.count(r"\d").to_numpy(dtype=np.int64)
+
+        # A SHA-256 digest has 32 bytes, one fake digit each; longer numbers
+        # take the scalar path so they behave exactly like anonymize_phone
+        batched = (counts >= 7) & (counts <= 32)
+        if batched.any():
+            digests = self.hash_series(pd.Series(phones[batched], dtype=object))
+            digest_bytes = np.frombuffer(bytes.fromhex("".join(digests)), np.uint8)
+            fake = (digest_bytes.reshape(-1, 32) % 10 + ord("0")).astype(np.uint8)
+            phones[batched] = [
+                self._replace_digits(phone, digits[:count].decode())
+                for phone, digits, count in zip(
+                    phones[batched], fake.view("S32").ravel(), counts[batched]
+                )
+            ]
+        overflow = counts > 32
+        phones[overflow] = [self.anonymize_phone(phone) for phone in phones[overflow]]
+
+        result[is_phone] = phones
+        return pd.Series(result, index=series.index, name=series.name)
+
     def anonymize_ssn(self, ssn: str) -> str:
         """Anonymize Social Security Numbers."""
         if not isinstance(ssn, str):
@@ -239,23 +541,29 @@ class DataAnonymizer:
         fake_ssn = f"{numeric_hash[:3]}-{numeric_hash[3:5]}-{numeric_hash[5:9]}"
 
         # Preserve original format if different
-        if re.match(r"\d{3}-\d{2}-\d{4}", ssn):
+        if SSN_DASHED_RE.match(ssn):
             return fake_ssn
-        elif re.match(r"\d{9}", ssn):
+        elif SSN_DIGITS_RE.match(ssn):
             return fake_ssn.replace("-", "")
         else:
             return fake_ssn
 
-    def k_anonymity_suppress(self, series: pd.Series, k: int = 5) -> pd.Series:
-        """Suppress values that appear less than k times."""
-        value_counts = series.value_counts()
-        suppressed = series.copy()
+    def k_anonymity_suppress(
+        self,
+        series: pd.Series,
+        k: int = 5,
+        value_counts: Optional[pd.Series] = None,
+    ) -> pd.Series:
+        """Suppress values that appear less than k times.
 
-        for value, count in value_counts.items():
-            if count < k:
-                suppressed = suppressed.replace(value, "[SUPPRESSED]")
+        Pass precomputed ``series.value_counts()`` to reuse them across k values.
+        """
+        if value_counts is None:
+            value_counts = series.value_counts()
+        keep = value_counts[value_counts >= k].index
 
-        return suppressed
+        # Missing values are never counted, so leave them untouched
+        return series.where(series.isin(keep) | series.isna(), "[SUPPRESSED]")
 
     def differential_privacy_noise(
         self, value: Any, epsilon: float = 1.0
@@ -288,8 +596,35 @@ class DataAnonymizer:
         else:
             return "[REDACTED]"
 
-    def shuffle_column(self, series: pd.Series) -> pd.Series:
+    def substitute_column(
+        self, series: pd.Series, logic_details: Dict[str, Any]
+    ) -> pd.Series:
+        """Substitute a whole column with a single batched random draw."""
+        replacement_list = logic_details.get("list", None)
+        data_type = logic_details.get("type", "generic")
+
+        if replacement_list:
+            choices = np.array(replacement_list, dtype=object)
+        elif data_type in self._substitution_arrays:
+            choices = self._substitution_arrays[data_type]
+        else:
+            return pd.Series("[REDACTED]", index=series.index, name=series.name)
+
+        return pd.Series(
+            self._secure_batch.choice(choices, len(series)),
+            index=series.index,
+            name=series.name,
+        )
+
+    def shuffle_column(
+        self, series: pd.Series, n_shuffles: Optional[int] = None
+    ) -> Union[pd.Series, np.ndarray]:
         """Shuffle values in a pandas Series using cryptographically secure random."""
+        if n_shuffles is not None:
+            # Many independent shuffles as rows of one array, in one batched draw
+            rows = np.tile(series.to_numpy(), (n_shuffles, 1))
+            return self._secure_batch.permuted_rows(rows)
+
         shuffled = series.copy()
         # Convert to list for shuffling
         values = shuffled.tolist()
@@ -331,118 +666,292 @@ class DataAnonymizer:
         else:
             return result
 
-    def anonymize_dataframe(
-        self, df: pd.DataFrame, masking_config: Dict[str, Any]
-    ) -> pd.DataFrame:
-        """Anonymize a single DataFrame based on enhanced masking configuration."""
-        df_anon = df.copy()
+    def _add_column_noise(
+        self, series: pd.Series, noise: np.ndarray, non_negative: bool = False
+    ) -> pd.Series:
+        """Add pre-drawn noise to a numeric column, keeping integer columns integral."""
+        # Nullable and Arrow columns carry NA as NaN through the arithmetic
+        result = series.to_numpy(dtype=np.float64, na_value=np.nan) + noise
+        if non_negative:
+            result = np.abs(result)
+
+        dtype = series.dtype
+        if dtype.kind == "i":
+            result = np.trunc(result)
+            # Keep narrow columns narrow unless the noise pushed them out of range
+            info = np.iinfo(getattr(dtype, "numpy_dtype", dtype))
+            valid = result[~np.isnan(result)]
+            if len(valid) and not (info.min <= valid.min() and valid.max() <= info.max):
+                if isinstance(dtype, pd.ArrowDtype):
+                    dtype = pd.ArrowDtype(pa.int64())
+                elif isinstance(dtype, np.dtype):
+                    dtype = np.dtype(np.int64)
+                else:
+                    dtype = pd.Int64Dtype()
 
-        for col, config in masking_config.items():
-            if col not in df_anon.columns:
-                continue
+        # Casting back restores NA (and the original dtype) for missing values
+        return pd.Series(result, index=series.index, name=series.name).astype(dtype)
+
+    def differential_privacy_series(
+        self, series: pd.Series, epsilon: float = 1.0
+    ) -> pd.Series:
+        """Add differential privacy noise to a column with one batched draw."""
+        if series.dtype.kind not in "if":
+            return series.apply(lambda x: self.differential_privacy_noise(x, epsilon))
+
+        scale = 1.0 / epsilon
+        return self._add_column_noise(
+            series, self._secure_batch.standard_normal(len(series)) * scale
+        )
 
+    def perturb_series(
+        self, series: pd.Series, logic_details: Dict[str, Any]
+    ) -> pd.Series:
+        """Perturb a column with one batched draw (see perturb_value)."""
+        if series.dtype.kind not in "if":
+            return series.apply(lambda x: self.perturb_value(x, logic_details))
+
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        perturbation_type = logic_details.get("type", "uniform")
+        perturbation_range = logic_details.get("range", np.abs(values) * 0.1)
+        size = len(values)
+
+        if perturbation_type == "gaussian":
+            noise = self._secure_batch.standard_normal(size) * perturbation_range
+        elif perturbation_type == "percentage":
+            percentage = logic_details.get("percentage", 10)
+            noise = (
+                self._secure_batch.uniform(-1, 1, size) * (percentage / 100) * values
+            )
+        else:
+            noise = self._secure_batch.uniform(-1, 1, size) * perturbation_range
+
+        return self._add_column_noise(
+            series, noise, logic_details.get("non_negative", False)
+        )
+
+    def _column_operation(
+        self, method: str, options: Dict[str, Any]
+    ) -> Optional[Callable[[pd.Series], pd.Series]]:
+        """Build the column transform for a method (None removes the column)."""
+        if method == "hash":
+            algorithm = options.get("algorithm", "sha256")
+            return lambda col: self.hash_series(col, algorithm)
+
+        elif method == "mask":
+            mask_char = options.get("mask_char", "*")
+            preserve_length = options.get("preserve_length", True)
+            return lambda col: col.apply(
+                lambda x: self.mask_value(x, mask_char, preserve_length)
+            )
+
+        elif method == "pseudonymize":
+            prefix = options.get("prefix", "ID")
+            return lambda col: self._pseudonymize_column(col, prefix)
+
+        elif method == "generalize_numeric":
+            bin_size = options.get("bin_size", 10)
+            return lambda col: self.generalize_numeric_series(col, bin_size)
+
+        elif method == "generalize_date":
+            granularity = options.get("granularity", "month")
+            return lambda col: self.generalize_date_series(col, granularity)
+
+        elif method == "anonymize_email":
+            return lambda col: self._dedup_apply(col, self.anonymize_email_series)
+
+        elif method == "anonymize_phone":
+            return lambda col: self._dedup_apply(col, self.anonymize_phone_series)
+
+        elif method == "anonymize_ssn":
+            return lambda col: col.apply(self.anonymize_ssn)
+
+        elif method == "k_anonymity":
+            k = options.get("k", 5)
+            return lambda col: self.k_anonymity_suppress(col, k)
+
+        elif method == "differential_privacy":
+            epsilon = options.get("epsilon", 1.0)
+            return lambda col: self.differential_privacy_series(col, epsilon)
+
+        elif method == "shuffle":
+            return self.shuffle_column
+
+        elif method == "substitute":
+            return lambda col: self.substitute_column(col, options)
+
+        elif method == "perturb":
+            return lambda col: self.perturb_series(col, options)
+
+        elif method == "remove":
+            # Complete removal of the column
+            return None
+
+        else:
+            # Default to hashing for unknown methods
+            return self.hash_series
+
+    def _dedup_apply(
+        self, series: pd.Series, operation: Callable[[pd.Series], pd.Series]
+    ) -> pd.Series:
+        """Apply an element-wise operation to distinct values when they repeat."""
+        codes, uniques = self._factorize_exact(series)
+        if len(uniques) >= len(series) // 2:
+            # Mostly unique; deduplicating would not pay for itself
+            return operation(series)
+
+        mapped = operation(pd.Series(uniques, name=series.name)).to_numpy(dtype=object)
+        missing = codes == -1
+        result = np.empty(len(series), dtype=object)
+        result[~missing] = mapped.take(codes[~missing])
+        if missing.any():
+            result[missing] = operation(series[missing]).to_numpy(dtype=object)
+
+        return pd.Series(result, index=series.index, name=series.name)
+
+    def _anonymize_categorical(
+        self, series: pd.Series, operation: Callable[[pd.Series], pd.Series]
+    ) -> pd.Series:
+        """Apply an element-wise operation once per category instead of per row."""
+        categories = pd.Series(
+            series.cat.categories.to_numpy(dtype=object), name=series.name
+        )
+        mapped = operation(categories).to_numpy(dtype=object)
+        codes = series.cat.codes.to_numpy()
+
+        # Distinct categories may map to the same output (e.g. numeric bins)
+        mapped_codes, new_categories = pd.factorize(mapped)
+        missing = codes == -1
+        if not missing.any() and (mapped_codes >= 0).all():
+            result = pd.Categorical.from_codes(mapped_codes[codes], new_categories)
+        else:
+            values = mapped.take(codes)
+            if missing.any():
+                values[missing] = operation(series[missing].astype(object)).to_numpy(
+                    dtype=object
+                )
+            result = pd.Categorical(values)
+
+        return pd.Series(result, index=series.index, name=series.name)
+
+    def _compile_config(
+        self, masking_config: Dict[str, Any]
+    ) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """Compile a masking configuration into a reusable DataFrame kernel."""
+        try:
+            cache_key = _config_cache_key(masking_config)
+        except TypeError:
+            # Options holding arbitrary objects are compiled without caching
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._kernel_cache:
+            # Re-insert to mark the kernel as most recently used
+            kernel = self._kernel_cache.pop(cache_key)
+            self._kernel_cache[cache_key] = kernel
+            return kernel
+
+        # Resolve methods and options once instead of once per call
+        operations = {}
+        for col, config in masking_config.items():
             # Handle both simple string method and complex dictionary config
             if isinstance(config, str):
                 method = config
                 options = {}
             else:
                 method = config.get("method", "hash")
-                options = config.get("options", {})
+                options = copy.deepcopy(config.get("options", {}))
 
             try:
-                if method == "hash":
-                    algorithm = options.get("algorithm", "sha256")
-                    df_anon[col] = (
-                        df_anon[col]
-                        .astype(str)
-                        .apply(lambda x: self.hash_value(x, algorithm))
-                    )
-
-                elif method == "mask":
-                    mask_char = options.get("mask_char", "*")
-                    preserve_length = options.get("preserve_length", True)
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.mask_value(x, mask_char, preserve_length)
-                    )
-
-                elif method == "pseudonymize":
-                    prefix = options.get("prefix", "ID")
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.pseudonymize_value(x, prefix)
-                    )
-
-                elif method == "generalize_numeric":
-                    bin_size = options.get("bin_size", 10)
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.generalize_numeric(x, bin_size)
-                    )
-
-                elif method == "generalize_date":
-                    granularity = options.get("granularity", "month")
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.generalize_date(x, granularity)
-                    )
-
-                elif method == "anonymize_email":
-                    df_anon[col] = df_anon[col].apply(self.anonymize_email)
-
-                elif method == "anonymize_phone":
-                    df_anon[col] = df_anon[col].apply(self.anonymize_phone)
-
-                elif method == "anonymize_ssn":
-                    df_anon[col] = df_anon[col].apply(self.anonymize_ssn)
-
-                elif method == "k_anonymity":
-                    k = options.get("k", 5)
-                    df_anon[col] = self.k_anonymity_suppress(df_anon[col], k)
-
-                elif method == "differential_privacy":
-                    epsilon = options.get("epsilon", 1.0)
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.differential_privacy_noise(x, epsilon)
-                    )
-
-                elif method == "shuffle":
-                    df_anon[col] = self.shuffle_column(df_anon[col])
-
-                elif method == "substitute":
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.substitute_value(x, options)
-                    )
-
-                elif method == "perturb":
-                    df_anon[col] = df_anon[col].apply(
-                        lambda x: self.perturb_value(x, options)
-                    )
-
-                elif method == "remove":
-                    # Complete removal of the column
-                    df_anon = df_anon.drop(columns=[col])
+                operation = self._column_operation(method, options)
+            except Exception as e:
+                # Malformed options are reported when the column is processed
+                def operation(col: pd.Series, error: Exception = e) -> pd.Series:
+                    raise error
 
-                else:
-                    # Default to hashing for unknown methods
-                    df_anon[col] = (
-                        df_anon[col].astype(str).apply(lambda x: self.hash_value(x))
-                    )
+            operations[col] = (method, operation)
 
+        def transform(col: Any, series: pd.Series) -> pd.Series:
+            method, operation = operations[col]
+            try:
+                if (
+                    isinstance(series.dtype, pd.CategoricalDtype)
+                    and method not in ROW_DEPENDENT_METHODS
+                ):
+                    return self._anonymize_categorical(series, operation)
+                return operation(series)
             except Exception as e:
                 # Log error and skip problematic column
                 print(f"Error processing column {col} with method {method}: {e}")
-                continue
+                return series
+
+        def kernel(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+            if inplace:
+                # Replace columns one at a time so each original buffer can be
+                # released before the next column is transformed
+                removed = []
+                for position, col in enumerate(df.columns):
+                    if col not in operations:
+                        continue
+                    if operations[col][1] is None:
+                        removed.append(col)
+                    else:
+                        df.isetitem(position, transform(col, df.iloc[:, position]))
+
+                if removed:
+                    df.drop(columns=removed, inplace=True)
+                return df
+
+            # Only transformed columns are allocated; the rest pass through as-is
+            columns = {}
+            kept = []
+
+            for position, col in enumerate(df.columns):
+                series = df.iloc[:, position]
+
+                if col in operations:
+                    if operations[col][1] is None:
+                        continue
+                    series = transform(col, series)
 
-        return df_anon
+                columns[len(kept)] = series
+                kept.append(position)
+
+            df_anon = pd.DataFrame(
+                columns, index=df.index, copy=not PANDAS_COPY_ON_WRITE
+            )
+            df_anon.columns = df.columns[kept]
+            return df_anon
+
+        if cache_key is not None:
+            if len(self._kernel_cache) >= KERNEL_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._kernel_cache[next(iter(self._kernel_cache))]
+            self._kernel_cache[cache_key] = kernel
+        return kernel
+
+    def anonymize_dataframe(
+        self, df: pd.DataFrame, masking_config: Dict[str, Any], inplace: bool = False
+    ) -> pd.DataFrame:
+        """Anonymize a single DataFrame based on enhanced masking configuration.
+
+        With inplace=True the columns of df are replaced in place and df itself
+        is returned, which avoids holding a second copy of the data.
+        """
+        return self._compile_config(masking_config)(df, inplace)
 
     def load_data(
         self, input_path: str, selected_sheet: Optional[str] = None
     ) -> Dict[str, pd.DataFrame]:
-        """Load data from CSV or Excel file."""
+        """Load data from CSV, Excel or Parquet file."""
         input_path = Path(input_path)
 
         if input_path.suffix.lower() == ".csv":
-            df = pd.read_csv(input_path)
+            df = self._read_csv(input_path)
             return {"Sheet1": df}
+        elif input_path.suffix.lower() == ".parquet":
+            return {"Sheet1": pd.read_parquet(input_path)}
         elif input_path.suffix.lower() in [".xlsx", ".xls"]:
-            xls = pd.ExcelFile(input_path)
+            xls = pd.ExcelFile(input_path, engine=EXCEL_READ_ENGINE)
             if selected_sheet and selected_sheet in xls.sheet_names:
                 return {selected_sheet: xls.parse(selected_sheet)}
             else:
@@ -450,6 +959,47 @@ class DataAnonymizer:
         else:
             raise ValueError(f"Unsupported file type: {input_path.suffix}")
 
+    def _read_csv(self, input_path: Path) -> pd.DataFrame:
+        """Read a CSV file with the multi-threaded Arrow parser.
+
+        The result matches pd.read_csv; files the Arrow parser cannot read the
+        same way are handed to pandas instead.
+        """
+        convert_options = pa_csv.ConvertOptions(
+            null_values=CSV_NULL_VALUES, strings_can_be_null=True
+        )
+        try:
+            table = pa_csv.read_csv(input_path, convert_options=convert_options)
+        except pa.ArrowInvalid:
+            return pd.read_csv(input_path)
+
+        # pandas renames duplicate and blank headers ("a.1", "Unnamed: 0")
+        names = table.column_names
+        if "" in names or len(set(names)) != len(names):
+            return pd.read_csv(input_path)
+
+        schema = table.schema
+        for i, field in enumerate(schema):
+            if pa.types.is_date32(field.type):
+                # Arrow infers ISO dates, which pandas keeps as text; date32
+                # is only inferred for YYYY-MM-DD, so the text round-trips
+                schema = schema.set(i, field.with_type(pa.string()))
+            elif pa.types.is_temporal(field.type):
+                return pd.read_csv(input_path)
+            elif pa.types.is_floating(field.type):
+                # Integers beyond int64 become doubles in Arrow but uint64 or
+                # exact text in pandas
+                largest = pc.max(pc.abs(table.column(i))).as_py()
+                if largest is not None and largest >= 2**63:
+                    return pd.read_csv(input_path)
+            elif pa.types.is_null(field.type):
+                # All-empty columns are float NaN in pandas, not Arrow nulls
+                schema = schema.set(i, field.with_type(pa.float64()))
+
+        # One block per column avoids a consolidation copy, and self_destruct
+        # frees each Arrow column as soon as it has been converted
+        return table.cast(schema).to_pandas(split_blocks=True, self_destruct=True)
+
     def save_data(self, data: Dict[str, pd.DataFrame], output_path: str) -> None:
         """Save anonymized data to file."""
         output_path = Path(output_path)
@@ -459,7 +1009,7 @@ class DataAnonymizer:
             first_sheet = next(iter(data.values()))
             first_sheet.to_csv(output_path, index=False)
         elif output_path.suffix.lower() in [".xlsx", ".xls"]:
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+            with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
                 for sheet_name, df in data.items():
                     df.to_excel(writer, sheet_name=sheet_name, index=False)
         else:
@@ -484,13 +1034,10 @@ def run_anonymization_job(
     # Load data
     sheets = anonymizer.load_data(input_path, selected_sheet)
 
-    # Anonymize data
-    anonymized_sheets = {}
+    # Anonymize data; the loaded frames are not needed afterwards
     for sheet_name, df in sheets.items():
         sheet_masking_config = masking_config.get(sheet_name, {})
-        anonymized_sheets[sheet_name] = anonymizer.anonymize_dataframe(
-            df, sheet_masking_config
-        )
+        anonymizer.anonymize_dataframe(df, sheet_masking_config, inplace=True)
 
     # Save anonymized data
-    anonymizer.save_data(anonymized_sheets, output_path)
+    anonymizer.save_data(sheets, output_path)
@@ -29,7 +29,11 @@ class Config:
     SAMPLES_DIR: Path = PROJECT_ROOT / "samples"
 
     # File settings
-    ALLOWED_EXTENSIONS: Dict[str, list] = {"csv": [".csv"], "excel": [".xlsx", ".xls"]}
+    ALLOWED_EXTENSIONS: Dict[str, list] = {
+        "csv": [".csv"],
+        "excel": [".xlsx", ".xls"],
+        "parquet": [".parquet"],
+    }
 
     # CORS settings
     CORS_ORIGINS: list = ["*"]
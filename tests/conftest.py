@@ -1,13 +1,10 @@
 """Test configuration and fixtures for the test suite."""
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
-import os
-import sys
-
-# Add the src directory to the path so we can import the modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import uuid
 
 # Test configuration
 @pytest.fixture(scope="session")
@@ -19,15 +16,50 @@ def test_config():
         "temp_dir": tempfile.gettempdir()
     }
 
+@pytest.fixture(scope="session")
+def client():
+    """API test client shared by the whole session (lifespan runs once)."""
+    from fastapi.testclient import TestClient
+    from src.data_anonymizer.api.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+@pytest.fixture(scope="session")
+def upload(client):
+    """Upload helper that posts a file through the shared client."""
+    def post(name, data, mime="text/csv"):
+        return client.post("/api/v1/upload", files={"file": (name, data, mime)})
+
+    return post
+
+@pytest.fixture(scope="session")
+def unique_name():
+    """Factory for upload filenames, so parallel workers never collide."""
+    names = []
+
+    def make(suffix=".csv"):
+        name = f"t_{uuid.uuid4().hex}{suffix}"
+        names.append(name)
+        return name
+
+    yield make
+
+    # Cleanup uploads and any anonymized results written for them
+    uploads_dir = Path("uploads")
+    for name in names:
+        csv_name = Path(name).with_suffix(".csv").name
+        for path in (
+            uploads_dir / name,
+            uploads_dir / f"anonymized_{name}",
+            uploads_dir / f"anonymized_{csv_name}",
+        ):
+            path.unlink(missing_ok=True)
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Temporary directory for test files (isolated per xdist worker)."""
+    return tmp_path
 
 @pytest.fixture
 def sample_csv_data():
@@ -69,3 +101,16 @@ def privacy_test_data():
         'income': [45000, 55000, 65000, 75000, 85000],
         'diagnosis': ['Diabetes', 'Hypertension', 'Diabetes', 'Healthy', 'Hypertension']
     }
+
+@pytest.fixture
+def os_entropy(monkeypatch):
+    """Record os.urandom calls, to check a code path draws from the OS CSPRNG."""
+    calls = []
+    urandom = os.urandom
+
+    def recording_urandom(n):
+        calls.append(n)
+        return urandom(n)
+
+    monkeypatch.setattr(os, "urandom", recording_urandom)
+    return calls
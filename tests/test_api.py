@@ -1,21 +1,148 @@
 """Tests for the FastAPI anonymization API."""
 
 import pytest
+import asyncio
+import io
 import json
-import tempfile
-from pathlib import Path
-from fastapi.testclient import TestClient
+import time
+import httpx
 import pandas as pd
 
 from src.data_anonymizer.api.main import app
 
-client = TestClient(app)
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# CSV payloads are kept as bytes so uploads skip per-test encoding
+CONTACTS_CSV = b"name,age,email\nJohn Doe,25,john@example.com\nJane Smith,30,jane@example.com"
+MINIMAL_CSV = b"name,age\nJohn Doe,25"
+WORKFLOW_CSV = (
+    b"name,age,email,phone\n"
+    b"John Doe,25,john@example.com,(555) 123-4567\n"
+    b"Jane Smith,30,jane@example.com,555-987-6543"
+)
+ANONYMIZE_CSV = (
+    b"name,age,email,salary,phone,department\n"
+    b"John Doe,25,john@example.com,50000,(555) 123-4567,Engineering\n"
+    b"Jane Smith,30,jane@example.com,60000,555-987-6543,Marketing"
+)
+
+# Masking configs are serialized once at import time
+SIMPLE_MASK = json.dumps({
+    "Sheet1": {
+        "name": "hash",
+        "email": "anonymize_email"
+    }
+})
+COMPLEX_MASK = json.dumps({
+    "Sheet1": {
+        "name": {"method": "mask", "options": {"mask_char": "*", "preserve_length": True}},
+        "age": {"method": "generalize_numeric", "options": {"bin_size": 10}},
+        "salary": {"method": "perturb", "options": {"type": "percentage", "percentage": 10}},
+        "phone": "anonymize_phone",
+        "department": {"method": "substitute", "options": {"type": "generic"}}
+    }
+})
+EMPLOYEES_MASK = json.dumps({
+    "Employees": {
+        "name": "hash"
+    }
+})
+NAME_HASH_MASK = json.dumps({"Sheet1": {"name": "hash"}})
+WORKFLOW_MASK = json.dumps({
+    "Sheet1": {
+        "name": "hash",
+        "email": "anonymize_email",
+        "phone": "anonymize_phone",
+        "age": {"method": "generalize_numeric", "options": {"bin_size": 10}}
+    }
+})
+MULTISHEET_MASK = json.dumps({
+    "Employees": {
+        "name": "hash",
+        "department": {"method": "substitute", "options": {"type": "generic"}}
+    },
+    "Departments": {
+        "budget": {"method": "perturb", "options": {"type": "percentage", "percentage": 15}}
+    }
+})
+
+
+def _xlsx_bytes(sheets):
+    """Serialize a {sheet_name: DataFrame} mapping to xlsx bytes."""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return buffer.getvalue()
+
+
+def async_client():
+    """In-process async client for tests that issue requests concurrently."""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    )
+
+
+async def wait_for_file(client, name, timeout=2.0):
+    """Poll the download endpoint with backoff until the file is served."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        response = await client.get(f"/api/v1/download/{name}")
+        if response.status_code == 200 or time.monotonic() >= deadline:
+            return response
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.25)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app(client):
+    """Send one request up front so cold-start cost lands in setup, not a test."""
+    client.get("/health")
+
+
+@pytest.fixture(scope="module")
+def uploaded_csv(upload, unique_name):
+    """One CSV upload covering every column the anonymize configs touch."""
+    name = unique_name()
+    response = upload(name, ANONYMIZE_CSV)
+    assert response.status_code == 200
+    return name
+
+
+@pytest.fixture(scope="session")
+def single_sheet_xlsx_bytes():
+    """Single-sheet workbook, built once per session."""
+    return _xlsx_bytes({
+        "Sheet1": pd.DataFrame({
+            "name": ["John Doe", "Jane Smith"],
+            "age": [25, 30],
+            "email": ["john@example.com", "jane@example.com"]
+        })
+    })
+
+
+@pytest.fixture(scope="session")
+def multi_sheet_xlsx_bytes():
+    """Employees/Departments workbook, built once per session."""
+    return _xlsx_bytes({
+        "Employees": pd.DataFrame({
+            "employee_id": [1, 2, 3],
+            "name": ["John Doe", "Jane Smith", "Bob Johnson"],
+            "department": ["IT", "HR", "Finance"]
+        }),
+        "Departments": pd.DataFrame({
+            "dept_id": [1, 2, 3],
+            "dept_name": ["IT", "HR", "Finance"],
+            "budget": [100000, 80000, 120000]
+        })
+    })
 
 
 class TestAnonymizerAPI:
     """Test suite for the anonymization API endpoints."""
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test the root endpoint."""
         response = client.get("/")
         assert response.status_code == 200
@@ -25,7 +152,7 @@ class TestAnonymizerAPI:
         assert "version" in data
         assert "docs" in data
 
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/health")
         assert response.status_code == 200
@@ -33,7 +160,7 @@ class TestAnonymizerAPI:
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_api_status(self):
+    def test_api_status(self, client):
         """Test API status endpoint."""
         response = client.get("/api/v1/status")
         assert response.status_code == 200
@@ -51,10 +178,10 @@ class TestAnonymizerAPI:
             "k_anonymity", "differential_privacy"
         ]
         
-        for method in expected_methods:
-            assert method in data["privacy_methods"]
+        missing = set(expected_methods) - set(data["privacy_methods"])
+        assert not missing, f"Missing privacy methods: {sorted(missing)}"
 
-    def test_list_samples(self):
+    def test_list_samples(self, client):
         """Test listing sample files."""
         response = client.get("/api/v1/samples")
         assert response.status_code == 200
@@ -62,7 +189,7 @@ class TestAnonymizerAPI:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_generate_samples(self):
+    def test_generate_samples(self, client):
         """Test generating sample data."""
         response = client.post("/api/v1/generate-samples")
         assert response.status_code == 200
@@ -72,330 +199,197 @@ class TestAnonymizerAPI:
         assert "files" in data
         assert isinstance(data["files"], list)
 
-    def test_upload_file_csv(self):
+    def test_upload_file_csv(self, upload, unique_name):
         """Test file upload with CSV."""
-        # Create a temporary CSV file
-        test_data = "name,age,email\nJohn Doe,25,john@example.com\nJane Smith,30,jane@example.com"
-        
-        files = {"file": ("test.csv", test_data, "text/csv")}
-        response = client.post("/api/v1/upload", files=files)
+        name = unique_name()
+        response = upload(name, CONTACTS_CSV)
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
-        assert data["filename"] == "test.csv"
+        assert data["filename"] == name
 
-    def test_upload_file_excel(self):
+    def test_upload_file_excel(self, upload, unique_name, single_sheet_xlsx_bytes):
         """Test file upload with Excel."""
-        # Create a temporary Excel file
-        df = pd.DataFrame({
-            "name": ["John Doe", "Jane Smith"],
-            "age": [25, 30],
-            "email": ["john@example.com", "jane@example.com"]
-        })
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            df.to_excel(f.name, index=False)
-            temp_path = Path(f.name)
-        
-        try:
-            with open(temp_path, 'rb') as f:
-                files = {"file": ("test.xlsx", f.read(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
-                response = client.post("/api/v1/upload", files=files)
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "success"
-            assert data["filename"] == "test.xlsx"
-        finally:
-            temp_path.unlink()
+        name = unique_name(".xlsx")
+        response = upload(name, single_sheet_xlsx_bytes, XLSX_MIME)
 
-    def test_anonymize_data_simple(self):
-        """Test data anonymization with simple configuration."""
-        # First upload a file
-        test_data = "name,age,email\nJohn Doe,25,john@example.com\nJane Smith,30,jane@example.com"
-        files = {"file": ("test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
-
-        # Then anonymize it
-        config = {
-            "Sheet1": {
-                "name": "hash",
-                "email": "anonymize_email"
-            }
-        }
-        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["filename"] == name
+
+    @pytest.mark.parametrize("masking_config,expected_status", [
+        (SIMPLE_MASK, 200),
+        (COMPLEX_MASK, 200),
+        ("invalid json", 400),
+        ("{}", 400),
+    ], ids=["simple", "complex", "invalid_json", "empty"])
+    def test_anonymize_data(self, client, uploaded_csv, masking_config, expected_status):
+        """Test data anonymization across valid and invalid configurations."""
         anonymize_data = {
-            "filename": "test.csv",
+            "filename": uploaded_csv,
             "output_format": "csv",
-            "masking_config": json.dumps(config)
+            "masking_config": masking_config
         }
-        
+
         response = client.post("/api/v1/anonymize", data=anonymize_data)
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["status"] == "processing"
-        assert "result_file" in data
-
-    def test_anonymize_data_complex_config(self):
-        """Test data anonymization with complex configuration."""
-        # Upload test file
-        test_data = "name,age,salary,phone,department\nJohn Doe,25,50000,(555) 123-4567,Engineering\nJane Smith,30,60000,555-987-6543,Marketing"
-        files = {"file": ("complex_test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
-
-        # Complex anonymization configuration
-        config = {
-            "Sheet1": {
-                "name": {"method": "mask", "options": {"mask_char": "*", "preserve_length": True}},
-                "age": {"method": "generalize_numeric", "options": {"bin_size": 10}},
-                "salary": {"method": "perturb", "options": {"type": "percentage", "percentage": 10}},
-                "phone": "anonymize_phone",
-                "department": {"method": "substitute", "options": {"type": "generic"}}
-            }
+        assert response.status_code == expected_status
+
+        if expected_status == 200:
+            data = response.json()
+            assert data["status"] == "processing"
+            assert "result_file" in data
+
+    def test_anonymize_excel_with_sheets(self, client, upload, unique_name, multi_sheet_xlsx_bytes):
+        """Test Excel anonymization with specific sheet selection."""
+        name = unique_name(".xlsx")
+        # Upload the multi-sheet file
+        upload(name, multi_sheet_xlsx_bytes, XLSX_MIME)
+
+        # Anonymize with sheet selection
+        anonymize_data = {
+            "filename": name,
+            "output_format": "xlsx",
+            "masking_config": EMPLOYEES_MASK,
+            "selected_sheet": "Employees"
         }
-        
+
+        response = client.post("/api/v1/anonymize", data=anonymize_data)
+        assert response.status_code == 200
+
+    def test_anonymize_parquet_writes_csv(self, client, upload, unique_name):
+        """Test that Parquet uploads are anonymized to a CSV result."""
+        name = unique_name(".parquet")
+        buffer = io.BytesIO()
+        pd.read_csv(io.BytesIO(CONTACTS_CSV)).to_parquet(buffer, index=False)
+        upload(name, buffer.getvalue(), "application/octet-stream")
+
         anonymize_data = {
-            "filename": "complex_test.csv",
-            "output_format": "csv",
-            "masking_config": json.dumps(config)
+            "filename": name,
+            "output_format": "parquet",
+            "masking_config": SIMPLE_MASK
         }
-        
+
         response = client.post("/api/v1/anonymize", data=anonymize_data)
         assert response.status_code == 200
-        
-        data = response.json()
-        assert data["status"] == "processing"
+        result_file = response.json()["result_file"]
+        assert result_file.endswith(".csv")
 
-    def test_anonymize_excel_with_sheets(self):
-        """Test Excel anonymization with specific sheet selection."""
-        # Create multi-sheet Excel file
-        df1 = pd.DataFrame({"name": ["John"], "age": [25]})
-        df2 = pd.DataFrame({"product": ["Widget"], "price": [100]})
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            with pd.ExcelWriter(f.name) as writer:
-                df1.to_excel(writer, sheet_name="Employees", index=False)
-                df2.to_excel(writer, sheet_name="Products", index=False)
-            temp_path = Path(f.name)
-        
-        try:
-            # Upload the file
-            with open(temp_path, 'rb') as f:
-                files = {"file": ("multi_sheet.xlsx", f.read(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
-                upload_response = client.post("/api/v1/upload", files=files)
-            
-            assert upload_response.status_code == 200
-            
-            # Anonymize with sheet selection
-            config = {
-                "Employees": {
-                    "name": "hash"
-                }
-            }
-            
-            anonymize_data = {
-                "filename": "multi_sheet.xlsx",
-                "output_format": "xlsx",
-                "masking_config": json.dumps(config),
-                "selected_sheet": "Employees"
-            }
-            
-            response = client.post("/api/v1/anonymize", data=anonymize_data)
-            assert response.status_code == 200
-            
-        finally:
-            temp_path.unlink()
+        # The TestClient runs the background job before returning
+        download_response = client.get(f"/api/v1/download/{result_file}")
+        assert download_response.status_code == 200
+        result = pd.read_csv(io.BytesIO(download_response.content))
+        assert list(result.columns) == ["name", "age", "email"]
+        assert "John Doe" not in result["name"].tolist()
 
-    def test_download_file(self):
+    def test_download_file(self, client, upload, unique_name):
         """Test file download."""
+        name = unique_name()
         # First upload a file
-        test_data = "name,age\nJohn Doe,25"
-        files = {"file": ("download_test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
+        upload(name, MINIMAL_CSV)
 
         # Then download it
-        response = client.get("/api/v1/download/download_test.csv")
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/octet-stream"
+        # Stream it so only the headers are inspected, never the whole body
+        with client.stream("GET", f"/api/v1/download/{name}") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/octet-stream"
 
-    def test_download_nonexistent_file(self):
+    def test_download_nonexistent_file(self, client):
         """Test downloading non-existent file."""
         response = client.get("/api/v1/download/nonexistent.csv")
         assert response.status_code == 404
 
-    def test_anonymize_invalid_config(self):
-        """Test anonymization with invalid configuration."""
-        # Upload a file first
-        test_data = "name,age\nJohn Doe,25"
-        files = {"file": ("invalid_config_test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
-
-        # Try to anonymize with invalid JSON
-        anonymize_data = {
-            "filename": "invalid_config_test.csv",
-            "output_format": "csv",
-            "masking_config": "invalid json"
-        }
-        
-        response = client.post("/api/v1/anonymize", data=anonymize_data)
-        assert response.status_code == 400
-
-    def test_anonymize_nonexistent_file(self):
+    def test_anonymize_nonexistent_file(self, client):
         """Test anonymization with non-existent file."""
-        config = {"Sheet1": {"name": "hash"}}
-        
         anonymize_data = {
             "filename": "nonexistent.csv",
             "output_format": "csv",
-            "masking_config": json.dumps(config)
+            "masking_config": NAME_HASH_MASK
         }
         
         response = client.post("/api/v1/anonymize", data=anonymize_data)
         assert response.status_code == 404
 
-    def test_anonymize_empty_config(self):
-        """Test anonymization with empty configuration."""
-        # Upload a file first
-        test_data = "name,age\nJohn Doe,25"
-        files = {"file": ("empty_config_test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
-
-        # Try to anonymize with empty config
-        anonymize_data = {
-            "filename": "empty_config_test.csv",
-            "output_format": "csv",
-            "masking_config": "{}"
-        }
-        
-        response = client.post("/api/v1/anonymize", data=anonymize_data)
-        assert response.status_code == 400
-
 
 class TestAPIErrorHandling:
     """Test error handling in the API."""
 
-    def test_upload_no_file(self):
+    def test_upload_no_file(self, client):
         """Test upload without file."""
         response = client.post("/api/v1/upload")
         assert response.status_code == 422  # Validation error
 
-    def test_anonymize_missing_parameters(self):
+    def test_anonymize_missing_parameters(self, client):
         """Test anonymization with missing parameters."""
         response = client.post("/api/v1/anonymize", data={"filename": "test.csv"})
         assert response.status_code == 422  # Validation error
 
-    def test_invalid_endpoints(self):
+    def test_invalid_endpoints(self, client):
         """Test invalid endpoints."""
+        # Unknown paths miss in routing before the method is considered
         response = client.get("/api/v1/nonexistent")
         assert response.status_code == 404
 
-        response = client.post("/api/v1/nonexistent")
-        assert response.status_code == 404
-
 
 class TestAPIIntegration:
     """Integration tests for the complete API workflow."""
 
-    def test_complete_anonymization_workflow(self):
+    @pytest.mark.asyncio
+    async def test_complete_anonymization_workflow(self, unique_name):
         """Test complete workflow from upload to download."""
-        # 1. Upload file
-        test_data = "name,age,email,phone\nJohn Doe,25,john@example.com,(555) 123-4567\nJane Smith,30,jane@example.com,555-987-6543"
-        files = {"file": ("workflow_test.csv", test_data, "text/csv")}
-        upload_response = client.post("/api/v1/upload", files=files)
-        assert upload_response.status_code == 200
-
-        # 2. Check samples (should include our uploaded file)
-        samples_response = client.get("/api/v1/samples")
-        assert samples_response.status_code == 200
-
-        # 3. Anonymize data
-        config = {
-            "Sheet1": {
-                "name": "hash",
-                "email": "anonymize_email",
-                "phone": "anonymize_phone",
-                "age": {"method": "generalize_numeric", "options": {"bin_size": 10}}
-            }
-        }
-        
+        name = unique_name()
         anonymize_data = {
-            "filename": "workflow_test.csv",
+            "filename": name,
             "output_format": "csv",
-            "masking_config": json.dumps(config)
+            "masking_config": WORKFLOW_MASK
         }
-        
-        anonymize_response = client.post("/api/v1/anonymize", data=anonymize_data)
-        assert anonymize_response.status_code == 200
-        
-        result_data = anonymize_response.json()
-        assert "result_file" in result_data
 
-        # 4. Download result (with some delay to allow processing)
-        import time
-        time.sleep(1)  # Allow background task to complete
-        
-        result_filename = result_data["result_file"]
-        download_response = client.get(f"/api/v1/download/{result_filename}")
-        # Note: Download might fail if background task hasn't completed
-        # In a real test, you'd implement proper async handling
+        async with async_client() as ac:
+            # 1. Upload file
+            await ac.post(
+                "/api/v1/upload", files={"file": (name, WORKFLOW_CSV, "text/csv")}
+            )
+
+            # 2. Check samples while 3. anonymizing (independent requests)
+            samples_response, anonymize_response = await asyncio.gather(
+                ac.get("/api/v1/samples"),
+                ac.post("/api/v1/anonymize", data=anonymize_data),
+            )
+            assert samples_response.status_code == 200
+            assert anonymize_response.status_code == 200
+
+            result_data = anonymize_response.json()
+            assert "result_file" in result_data
+
+            # 4. Download result once the background task has written it
+            download_response = await wait_for_file(ac, result_data["result_file"])
+            assert download_response.status_code == 200
 
-    def test_excel_multisheet_workflow(self):
+    @pytest.mark.asyncio
+    async def test_excel_multisheet_workflow(self, unique_name, multi_sheet_xlsx_bytes):
         """Test workflow with Excel multi-sheet file."""
-        # Create multi-sheet Excel file
-        df1 = pd.DataFrame({
-            "employee_id": [1, 2, 3],
-            "name": ["John Doe", "Jane Smith", "Bob Johnson"],
-            "department": ["IT", "HR", "Finance"]
-        })
-        df2 = pd.DataFrame({
-            "dept_id": [1, 2, 3],
-            "dept_name": ["IT", "HR", "Finance"],
-            "budget": [100000, 80000, 120000]
-        })
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            with pd.ExcelWriter(f.name) as writer:
-                df1.to_excel(writer, sheet_name="Employees", index=False)
-                df2.to_excel(writer, sheet_name="Departments", index=False)
-            temp_path = Path(f.name)
-        
-        try:
+        name = unique_name(".xlsx")
+        anonymize_data = {
+            "filename": name,
+            "output_format": "xlsx",
+            "masking_config": MULTISHEET_MASK
+        }
+
+        async with async_client() as ac:
             # Upload
-            with open(temp_path, 'rb') as f:
-                files = {"file": ("multisheet_workflow.xlsx", f.read(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
-                upload_response = client.post("/api/v1/upload", files=files)
-            
-            assert upload_response.status_code == 200
-            
+            await ac.post(
+                "/api/v1/upload",
+                files={"file": (name, multi_sheet_xlsx_bytes, XLSX_MIME)},
+            )
+
             # Anonymize with configuration for multiple sheets
-            config = {
-                "Employees": {
-                    "name": "hash",
-                    "department": {"method": "substitute", "options": {"type": "generic"}}
-                },
-                "Departments": {
-                    "budget": {"method": "perturb", "options": {"type": "percentage", "percentage": 15}}
-                }
-            }
-            
-            anonymize_data = {
-                "filename": "multisheet_workflow.xlsx",
-                "output_format": "xlsx",
-                "masking_config": json.dumps(config)
-            }
-            
-            anonymize_response = client.post("/api/v1/anonymize", data=anonymize_data)
+            anonymize_response = await ac.post("/api/v1/anonymize", data=anonymize_data)
             assert anonymize_response.status_code == 200
-            
-        finally:
-            temp_path.unlink()
+
+            result_file = anonymize_response.json()["result_file"]
+            download_response = await wait_for_file(ac, result_file)
+            assert download_response.status_code == 200
 
 
 if __name__ == "__main__":
@@ -1,36 +1,146 @@
 """Integration tests for the complete data anonymization workflow."""
 
 import pytest
-import tempfile
 import json
-from pathlib import Path
 import pandas as pd
 import numpy as np
+import openpyxl
 from io import StringIO
-import sys
-import os
-
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import time
 
 from data_anonymizer.core.anonymizer import DataAnonymizer, run_anonymization_job
 from data_anonymizer.utils.data_generator import SampleDataGenerator
 
+LARGE_DATASET_SIZE = 10000
+
+
+def _read_csv(path):
+    """Read a CSV written by a job with the multi-threaded pyarrow parser."""
+    return pd.read_csv(path, engine="pyarrow")
+
+
+def _first_row(ws):
+    """Map the header of a read-only worksheet to its first data row."""
+    header, first = ws.iter_rows(max_row=2, values_only=True)
+    return dict(zip(header, first))
+
+
+@pytest.fixture(scope="class")
+def anonymizer():
+    """One anonymizer per test class (compiled configs are safe to share)."""
+    return DataAnonymizer()
+
+
+@pytest.fixture(scope="class")
+def class_tmp_dir(tmp_path_factory):
+    """One scratch directory per test class; pytest cleans it up."""
+    return tmp_path_factory.mktemp("anon")
+
+
+@pytest.fixture(scope="class")
+def quality_df():
+    """Canonical frame for the data quality tests; each test selects its columns."""
+    return pd.DataFrame({
+        'text_col': ['A', 'B', 'C', 'D', 'E'],
+        'numeric_col': [1, 2, 3, 4, 5],
+        'float_col': [1.1, 2.2, 3.3, 4.4, 5.5],
+        'bool_col': [True, False, True, False, True],
+        'employee_id': [1, 2, 3, 4, 5],
+        'department': ['IT', 'HR', 'IT', 'Finance', 'HR'],
+        'salary': [80000, 60000, 85000, 75000, 65000],
+        'manager_id': [1, 2, 1, 4, 2],  # Some employees manage others
+        'unique_id': [1, 2, 3, 4, 5],
+        'email': ['a@test.com', 'b@test.com', 'c@test.com', 'd@test.com', 'e@test.com'],
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve']
+    })
+
+
+@pytest.fixture(scope="session")
+def large_parquet_path(tmp_path_factory):
+    """10k-row dataset, generated and written once per session."""
+    size = LARGE_DATASET_SIZE
+    rng = np.random.default_rng(0)
+    ids = pd.Index(np.arange(size)).astype(str)
+    companies = pd.Index(np.arange(size) % 100).astype(str)
+    large_data = pd.DataFrame({
+        'id': range(size),
+        'name': 'Person_' + ids,
+        'email': 'user' + ids + '@company' + companies + '.com',
+        'age': rng.integers(18, 80, size),
+        'salary': rng.integers(30000, 150000, size)
+    })
+
+    # Parquet input keeps setup cheap and the column dtypes intact
+    path = tmp_path_factory.mktemp("large") / "large_dataset.parquet"
+    large_data.to_parquet(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def healthcare_csv_path(tmp_path_factory):
+    """Healthcare-like records, written once per session."""
+    healthcare_data = pd.DataFrame({
+        'patient_id': ['P001', 'P002', 'P003', 'P004', 'P005'],
+        'name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown', 'Charlie Davis'],
+        'ssn': ['123-45-6789', '987-65-4321', '456-78-9012', '789-01-2345', '321-54-9876'],
+        'date_of_birth': ['1985-03-15', '1990-07-22', '1978-11-08', '1992-01-30', '1980-05-14'],
+        'diagnosis': ['Diabetes', 'Hypertension', 'Asthma', 'Diabetes', 'Hypertension'],
+        'treatment_cost': [5000, 3000, 2000, 5500, 3200],
+        'zip_code': ['12345', '67890', '54321', '98765', '13579']
+    })
+
+    path = tmp_path_factory.mktemp("healthcare") / "healthcare.csv"
+    healthcare_data.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def financial_csv_path(tmp_path_factory):
+    """Financial-like records, written once per session."""
+    financial_data = pd.DataFrame({
+        'account_id': ['ACC001', 'ACC002', 'ACC003', 'ACC004'],
+        'customer_name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown'],
+        'account_balance': [15000.50, 25000.75, 8000.25, 45000.00],
+        'transaction_amount': [500.00, 1200.50, 300.75, 2000.00],
+        'credit_score': [750, 680, 720, 800],
+        'branch_code': ['BR001', 'BR002', 'BR001', 'BR003']
+    })
+
+    path = tmp_path_factory.mktemp("financial") / "financial.csv"
+    financial_data.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def hr_csv_path(tmp_path_factory):
+    """HR-like records, written once per session."""
+    hr_data = pd.DataFrame({
+        'employee_id': ['E001', 'E002', 'E003', 'E004', 'E005'],
+        'full_name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown', 'Charlie Davis'],
+        'email': ['john@company.com', 'jane@company.com', 'bob@company.com', 'alice@company.com', 'charlie@company.com'],
+        'phone': ['555-1234', '555-5678', '555-9012', '555-3456', '555-7890'],
+        'salary': [75000, 85000, 65000, 95000, 70000],
+        'hire_date': ['2020-01-15', '2019-03-22', '2021-07-10', '2018-11-05', '2022-02-28'],
+        'department': ['Engineering', 'Marketing', 'Engineering', 'Sales', 'HR'],
+        'performance_rating': [4.2, 3.8, 4.5, 3.9, 4.1]
+    })
+
+    path = tmp_path_factory.mktemp("hr") / "hr_data.csv"
+    hr_data.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_csv(tmp_path_factory):
+    """100-row generated sample CSV, created once per session."""
+    generator = SampleDataGenerator(str(tmp_path_factory.mktemp("sample")))
+    return generator.generate_csv_sample("test_sample.csv", rows=100)
+
 
 class TestEndToEndWorkflow:
     """Test complete end-to-end anonymization workflows."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_csv_complete_workflow(self):
+    def test_csv_complete_workflow(self, class_tmp_dir):
         """Test complete CSV anonymization workflow."""
         # Create test CSV file
         test_data = pd.DataFrame({
@@ -42,8 +152,8 @@ class TestEndToEndWorkflow:
             'department': ['IT', 'HR', 'Finance']
         })
         
-        input_path = self.temp_dir / "test_input.csv"
-        output_path = self.temp_dir / "test_output.csv"
+        input_path = class_tmp_dir / "test_input.csv"
+        output_path = class_tmp_dir / "test_output.csv"
         
         test_data.to_csv(input_path, index=False)
         
@@ -69,20 +179,21 @@ class TestEndToEndWorkflow:
         
         # Verify output
         assert output_path.exists()
-        result_data = pd.read_csv(output_path)
+        result_data = _read_csv(output_path)
         
         # Verify structure
         assert len(result_data) == len(test_data)
-        assert set(result_data.columns) == set(test_data.columns)
+        assert list(result_data.columns) == list(test_data.columns)
         
         # Verify anonymization
-        assert result_data['name'].iloc[0] != 'John Doe'
-        assert '@' in result_data['email'].iloc[0]
-        assert result_data['phone'].iloc[0] != '(555) 123-4567'
-        assert '-' in result_data['age'].iloc[0]  # Should be generalized
-        assert result_data['salary'].iloc[0] != 50000  # Should be perturbed
-
-    def test_excel_multisheet_workflow(self):
+        first = result_data.iloc[0]
+        assert first['name'] != 'John Doe'
+        assert '@' in first['email']
+        assert first['phone'] != '(555) 123-4567'
+        assert '-' in first['age']  # Should be generalized
+        assert first['salary'] != 50000  # Should be perturbed
+
+    def test_excel_multisheet_workflow(self, class_tmp_dir):
         """Test complete Excel multi-sheet anonymization workflow."""
         # Create test Excel file with multiple sheets
         employees_data = pd.DataFrame({
@@ -98,10 +209,10 @@ class TestEndToEndWorkflow:
             'budget': [100000, 80000, 120000]
         })
         
-        input_path = self.temp_dir / "test_multisheet.xlsx"
-        output_path = self.temp_dir / "test_multisheet_output.xlsx"
+        input_path = class_tmp_dir / "test_multisheet.xlsx"
+        output_path = class_tmp_dir / "test_multisheet_output.xlsx"
         
-        with pd.ExcelWriter(input_path) as writer:
+        with pd.ExcelWriter(input_path, engine='xlsxwriter') as writer:
             employees_data.to_excel(writer, sheet_name='Employees', index=False)
             departments_data.to_excel(writer, sheet_name='Departments', index=False)
         
@@ -128,39 +239,31 @@ class TestEndToEndWorkflow:
         
         # Verify output
         assert output_path.exists()
-        result_sheets = pd.read_excel(output_path, sheet_name=None)
-        
-        # Verify structure
-        assert 'Employees' in result_sheets
-        assert 'Departments' in result_sheets
-        assert len(result_sheets['Employees']) == len(employees_data)
-        assert len(result_sheets['Departments']) == len(departments_data)
-        
-        # Verify anonymization
-        emp_result = result_sheets['Employees']
-        dept_result = result_sheets['Departments']
-        
-        assert emp_result['name'].iloc[0] != 'John Doe'
-        assert '@' in emp_result['email'].iloc[0]
-        assert dept_result['name'].iloc[0] != 'IT'
-        assert dept_result['budget'].iloc[0] != 100000
-
-    def test_large_dataset_workflow(self):
+        # Only the header and first data row are needed, so read lazily
+        wb = openpyxl.load_workbook(output_path, read_only=True, data_only=True)
+        try:
+            # Verify structure
+            assert {'Employees', 'Departments'} <= set(wb.sheetnames)
+            emp_ws = wb['Employees']
+            dept_ws = wb['Departments']
+            assert emp_ws.max_row - 1 == len(employees_data)
+            assert dept_ws.max_row - 1 == len(departments_data)
+
+            # Verify anonymization
+            emp_first = _first_row(emp_ws)
+            assert emp_first['name'] != 'John Doe'
+            assert '@' in emp_first['email']
+            dept_first = _first_row(dept_ws)
+            assert dept_first['name'] != 'IT'
+            assert dept_first['budget'] != 100000
+        finally:
+            wb.close()
+
+    @pytest.mark.slow
+    def test_large_dataset_workflow(self, class_tmp_dir, large_parquet_path):
         """Test workflow with large dataset."""
-        # Generate large dataset
-        size = 10000
-        large_data = pd.DataFrame({
-            'id': range(size),
-            'name': [f'Person_{i}' for i in range(size)],
-            'email': [f'user{i}@company{i%100}.com' for i in range(size)],
-            'age': np.random.randint(18, 80, size),
-            'salary': np.random.randint(30000, 150000, size)
-        })
-        
-        input_path = self.temp_dir / "large_dataset.csv"
-        output_path = self.temp_dir / "large_dataset_output.csv"
-        
-        large_data.to_csv(input_path, index=False)
+        input_path = large_parquet_path
+        output_path = class_tmp_dir / "large_dataset_output.csv"
         
         config = {
             'Sheet1': {
@@ -172,7 +275,6 @@ class TestEndToEndWorkflow:
         }
         
         # Run anonymization
-        import time
         start_time = time.time()
         
         run_anonymization_job(
@@ -187,17 +289,22 @@ class TestEndToEndWorkflow:
         
         # Verify output and performance
         assert output_path.exists()
-        result_data = pd.read_csv(output_path)
+        # Count rows without parsing, and only parse the row that is inspected
+        # (the pyarrow engine does not support nrows)
+        with open(output_path) as f:
+            row_count = sum(1 for _ in f) - 1
+        result_data = pd.read_csv(output_path, nrows=1)
         
-        assert len(result_data) == size
+        assert row_count == LARGE_DATASET_SIZE
         assert processing_time < 60  # Should complete within 1 minute
         
         # Verify anonymization quality
-        assert result_data['name'].iloc[0] != 'Person_0'
-        assert '@' in result_data['email'].iloc[0]
-        assert '-' in result_data['age'].iloc[0]  # Generalized format
+        first = result_data.iloc[0]
+        assert first['name'] != 'Person_0'
+        assert '@' in first['email']
+        assert '-' in first['age']  # Generalized format
 
-    def test_configuration_validation_workflow(self):
+    def test_configuration_validation_workflow(self, class_tmp_dir):
         """Test workflow with various configuration validations."""
         test_data = pd.DataFrame({
             'name': ['John Doe', 'Jane Smith'],
@@ -205,8 +312,8 @@ class TestEndToEndWorkflow:
             'email': ['john@example.com', 'jane@example.com']
         })
         
-        input_path = self.temp_dir / "validation_test.csv"
-        output_path = self.temp_dir / "validation_output.csv"
+        input_path = class_tmp_dir / "validation_test.csv"
+        output_path = class_tmp_dir / "validation_output.csv"
         
         test_data.to_csv(input_path, index=False)
         
@@ -228,13 +335,13 @@ class TestEndToEndWorkflow:
         )
         
         assert output_path.exists()
-        result_data = pd.read_csv(output_path)
+        result_data = _read_csv(output_path)
         
         # Should have processed with fallback method
         assert len(result_data) == 2
         assert result_data['name'].iloc[0] != 'John Doe'
 
-    def test_error_handling_workflow(self):
+    def test_error_handling_workflow(self, class_tmp_dir):
         """Test error handling in complete workflow."""
         # Test with non-existent input file
         with pytest.raises(FileNotFoundError):
@@ -247,13 +354,13 @@ class TestEndToEndWorkflow:
         
         # Test with invalid output format
         test_data = pd.DataFrame({'name': ['John']})
-        input_path = self.temp_dir / "error_test.csv"
+        input_path = class_tmp_dir / "error_test.csv"
         test_data.to_csv(input_path, index=False)
         
         with pytest.raises(ValueError):
             run_anonymization_job(
                 str(input_path),
-                str(self.temp_dir / "output.txt"),  # Invalid extension
+                str(class_tmp_dir / "output.txt"),  # Invalid extension
                 'txt',
                 {'Sheet1': {'name': 'hash'}}
             )
@@ -262,18 +369,9 @@ class TestEndToEndWorkflow:
 class TestDataQualityPreservation:
     """Test that data quality is preserved through anonymization."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-
-    def test_data_type_preservation(self):
+    def test_data_type_preservation(self, anonymizer, quality_df):
         """Test that data types are preserved where appropriate."""
-        df = pd.DataFrame({
-            'text_col': ['A', 'B', 'C'],
-            'numeric_col': [1, 2, 3],
-            'float_col': [1.1, 2.2, 3.3],
-            'bool_col': [True, False, True]
-        })
+        df = quality_df[['text_col', 'numeric_col', 'float_col', 'bool_col']]
         
         # Apply methods that should preserve types
         config = {
@@ -283,19 +381,19 @@ class TestDataQualityPreservation:
             'bool_col': 'hash'
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Check that numeric columns maintain numeric types
         assert pd.api.types.is_numeric_dtype(result['numeric_col'])
         assert pd.api.types.is_numeric_dtype(result['float_col'])
 
-    def test_statistical_properties_preservation(self):
+    def test_statistical_properties_preservation(self, anonymizer):
         """Test that statistical properties are reasonably preserved."""
         # Create data with known statistical properties
         np.random.seed(42)
         df = pd.DataFrame({
-            'values': np.random.normal(100, 15, 1000),
-            'categories': np.random.choice(['A', 'B', 'C'], 1000)
+            'values': np.random.normal(100, 15, 400),
+            'categories': np.random.choice(['A', 'B', 'C'], 400)
         })
         
         original_mean = df['values'].mean()
@@ -304,10 +402,10 @@ class TestDataQualityPreservation:
         
         config = {
             'values': {'method': 'perturb', 'options': {'type': 'gaussian', 'range': 5}},
-            'categories': {'method': 'k_anonymity', 'options': {'k': 50}}
+            'categories': {'method': 'k_anonymity', 'options': {'k': 20}}
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Check that statistical properties are reasonably preserved
         new_mean = result['values'].mean()
@@ -319,15 +417,10 @@ class TestDataQualityPreservation:
         # Standard deviation should be reasonably close
         assert abs(new_std - original_std) / original_std < 0.3
 
-    def test_relationship_preservation(self):
+    def test_relationship_preservation(self, anonymizer, quality_df):
         """Test that relationships between columns are preserved where intended."""
-        # Create data with known relationships
-        df = pd.DataFrame({
-            'employee_id': [1, 2, 3, 4, 5],
-            'department': ['IT', 'HR', 'IT', 'Finance', 'HR'],
-            'salary': [80000, 60000, 85000, 75000, 65000],
-            'manager_id': [1, 2, 1, 4, 2]  # Some employees manage others
-        })
+        # Data with known relationships
+        df = quality_df[['employee_id', 'department', 'salary', 'manager_id']]
         
         # Use consistent hashing for related fields
         config = {
@@ -337,7 +430,7 @@ class TestDataQualityPreservation:
             'manager_id': 'hash'  # Same method as employee_id
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Check that self-references are maintained
         # Employee 1 manages themselves and employee 3
@@ -346,13 +439,9 @@ class TestDataQualityPreservation:
         
         assert emp1_hash == emp3_manager_hash
 
-    def test_uniqueness_preservation(self):
+    def test_uniqueness_preservation(self, anonymizer, quality_df):
         """Test that uniqueness constraints are preserved."""
-        df = pd.DataFrame({
-            'unique_id': [1, 2, 3, 4, 5],
-            'email': ['a@test.com', 'b@test.com', 'c@test.com', 'd@test.com', 'e@test.com'],
-            'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve']
-        })
+        df = quality_df[['unique_id', 'email', 'name']]
         
         config = {
             'unique_id': 'hash',
@@ -360,7 +449,7 @@ class TestDataQualityPreservation:
             'name': 'hash'
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Check that all anonymized values are still unique
         assert len(result['unique_id'].unique()) == len(df['unique_id'].unique())
@@ -368,186 +457,115 @@ class TestDataQualityPreservation:
         assert len(result['name'].unique()) == len(df['name'].unique())
 
 
-class TestRealWorldScenarios:
-    """Test real-world anonymization scenarios."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_healthcare_data_scenario(self):
-        """Test anonymization of healthcare-like data."""
-        healthcare_data = pd.DataFrame({
-            'patient_id': ['P001', 'P002', 'P003', 'P004', 'P005'],
-            'name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown', 'Charlie Davis'],
-            'ssn': ['123-45-6789', '987-65-4321', '456-78-9012', '789-01-2345', '321-54-9876'],
-            'date_of_birth': ['1985-03-15', '1990-07-22', '1978-11-08', '1992-01-30', '1980-05-14'],
-            'diagnosis': ['Diabetes', 'Hypertension', 'Asthma', 'Diabetes', 'Hypertension'],
-            'treatment_cost': [5000, 3000, 2000, 5500, 3200],
-            'zip_code': ['12345', '67890', '54321', '98765', '13579']
-        })
-        
-        # HIPAA-compliant anonymization
-        config = {
-            'Sheet1': {
-                'patient_id': 'hash',
-                'name': 'hash',
-                'ssn': 'hash',
-                'date_of_birth': {'method': 'generalize_date', 'options': {'granularity': 'year'}},
-                'diagnosis': 'hash',
-                'treatment_cost': {'method': 'generalize_numeric', 'options': {'bin_size': 1000}},
-                'zip_code': {'method': 'generalize_numeric', 'options': {'bin_size': 10000}}
-            }
+def _check_healthcare(result):
+    """Verify HIPAA-style anonymization of the healthcare records."""
+    first = result.iloc[0]
+    assert first['name'] != 'John Doe'
+    assert first['ssn'] != '123-45-6789'
+    # Test that date is generalized to year format
+    assert first['date_of_birth'] == 1985 or first['date_of_birth'] == '1985'  # Both formats acceptable
+    assert first['diagnosis'] != 'Diabetes'
+    assert '-' in first['treatment_cost']  # Generalized
+    assert first['zip_code'] != '12345'  # Generalized
+
+
+def _check_financial(result):
+    """Verify anonymization of the financial records."""
+    first = result.iloc[0]
+    assert first['account_id'] != 'ACC001'
+    assert first['customer_name'] != 'John Doe'
+    assert first['account_balance'] != 15000.50
+    assert first['transaction_amount'] != 500.00
+    assert '-' in first['credit_score']  # Generalized
+    assert first['branch_code'] != 'BR001'
+
+
+def _check_hr(result):
+    """Verify anonymization of the HR records."""
+    first = result.iloc[0]
+    assert first['employee_id'] != 'E001'
+    assert first['full_name'] != 'John Doe'
+    assert '@' in first['email']
+    assert first['phone'] != '555-1234'
+    assert '-' in first['salary']  # Generalized
+    assert 'Q' in first['hire_date']  # Quarter format
+    assert first['department'] != 'Engineering' or first['department'] == '[REDACTED]'
+
+
+# Scenario name -> (masking config, output checks); inputs come from the
+# matching <name>_csv_path fixture
+SCENARIOS = {
+    # HIPAA-compliant anonymization
+    'healthcare': ({
+        'Sheet1': {
+            'patient_id': 'hash',
+            'name': 'hash',
+            'ssn': 'hash',
+            'date_of_birth': {'method': 'generalize_date', 'options': {'granularity': 'year'}},
+            'diagnosis': 'hash',
+            'treatment_cost': {'method': 'generalize_numeric', 'options': {'bin_size': 1000}},
+            'zip_code': {'method': 'generalize_numeric', 'options': {'bin_size': 10000}}
         }
-        
-        input_path = self.temp_dir / "healthcare.csv"
-        output_path = self.temp_dir / "healthcare_anonymized.csv"
-        
-        healthcare_data.to_csv(input_path, index=False)
-        
-        run_anonymization_job(
-            str(input_path),
-            str(output_path),
-            'csv',
-            config
-        )
-        
-        result = pd.read_csv(output_path)
-        
-        # Verify HIPAA compliance
-        assert result['name'].iloc[0] != 'John Doe'
-        assert result['ssn'].iloc[0] != '123-45-6789'
-        # Test that date is generalized to year format
-        assert result['date_of_birth'].iloc[0] == 1985 or result['date_of_birth'].iloc[0] == '1985'  # Both formats acceptable
-        assert result['diagnosis'].iloc[0] != 'Diabetes'
-        assert '-' in result['treatment_cost'].iloc[0]  # Generalized
-        assert result['zip_code'].iloc[0] != '12345'  # Generalized
-
-    def test_financial_data_scenario(self):
-        """Test anonymization of financial data."""
-        financial_data = pd.DataFrame({
-            'account_id': ['ACC001', 'ACC002', 'ACC003', 'ACC004'],
-            'customer_name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown'],
-            'account_balance': [15000.50, 25000.75, 8000.25, 45000.00],
-            'transaction_amount': [500.00, 1200.50, 300.75, 2000.00],
-            'credit_score': [750, 680, 720, 800],
-            'branch_code': ['BR001', 'BR002', 'BR001', 'BR003']
-        })
-        
-        # Financial services anonymization
-        config = {
-            'Sheet1': {
-                'account_id': 'hash',
-                'customer_name': 'hash',
-                'account_balance': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 10}},
-                'transaction_amount': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 15}},
-                'credit_score': {'method': 'generalize_numeric', 'options': {'bin_size': 50}},
-                'branch_code': 'hash'
-            }
+    }, _check_healthcare),
+    # Financial services anonymization
+    'financial': ({
+        'Sheet1': {
+            'account_id': 'hash',
+            'customer_name': 'hash',
+            'account_balance': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 10}},
+            'transaction_amount': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 15}},
+            'credit_score': {'method': 'generalize_numeric', 'options': {'bin_size': 50}},
+            'branch_code': 'hash'
         }
-        
-        input_path = self.temp_dir / "financial.csv"
-        output_path = self.temp_dir / "financial_anonymized.csv"
-        
-        financial_data.to_csv(input_path, index=False)
-        
-        run_anonymization_job(
-            str(input_path),
-            str(output_path),
-            'csv',
-            config
-        )
-        
-        result = pd.read_csv(output_path)
-        
-        # Verify financial data anonymization
-        assert result['account_id'].iloc[0] != 'ACC001'
-        assert result['customer_name'].iloc[0] != 'John Doe'
-        assert result['account_balance'].iloc[0] != 15000.50
-        assert result['transaction_amount'].iloc[0] != 500.00
-        assert '-' in result['credit_score'].iloc[0]  # Generalized
-        assert result['branch_code'].iloc[0] != 'BR001'
-
-    def test_hr_data_scenario(self):
-        """Test anonymization of HR data."""
-        hr_data = pd.DataFrame({
-            'employee_id': ['E001', 'E002', 'E003', 'E004', 'E005'],
-            'full_name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown', 'Charlie Davis'],
-            'email': ['john@company.com', 'jane@company.com', 'bob@company.com', 'alice@company.com', 'charlie@company.com'],
-            'phone': ['555-1234', '555-5678', '555-9012', '555-3456', '555-7890'],
-            'salary': [75000, 85000, 65000, 95000, 70000],
-            'hire_date': ['2020-01-15', '2019-03-22', '2021-07-10', '2018-11-05', '2022-02-28'],
-            'department': ['Engineering', 'Marketing', 'Engineering', 'Sales', 'HR'],
-            'performance_rating': [4.2, 3.8, 4.5, 3.9, 4.1]
-        })
-        
-        # HR anonymization preserving some analytics capability
-        config = {
-            'Sheet1': {
-                'employee_id': 'hash',
-                'full_name': 'hash',
-                'email': 'anonymize_email',
-                'phone': 'anonymize_phone',
-                'salary': {'method': 'generalize_numeric', 'options': {'bin_size': 10000}},
-                'hire_date': {'method': 'generalize_date', 'options': {'granularity': 'quarter'}},
-                'department': {'method': 'substitute', 'options': {'type': 'generic'}},
-                'performance_rating': {'method': 'perturb', 'options': {'type': 'uniform', 'range': 0.2}}
-            }
+    }, _check_financial),
+    # HR anonymization preserving some analytics capability
+    'hr': ({
+        'Sheet1': {
+            'employee_id': 'hash',
+            'full_name': 'hash',
+            'email': 'anonymize_email',
+            'phone': 'anonymize_phone',
+            'salary': {'method': 'generalize_numeric', 'options': {'bin_size': 10000}},
+            'hire_date': {'method': 'generalize_date', 'options': {'granularity': 'quarter'}},
+            'department': {'method': 'substitute', 'options': {'type': 'generic'}},
+            'performance_rating': {'method': 'perturb', 'options': {'type': 'uniform', 'range': 0.2}}
         }
-        
-        input_path = self.temp_dir / "hr_data.csv"
-        output_path = self.temp_dir / "hr_anonymized.csv"
-        
-        hr_data.to_csv(input_path, index=False)
-        
+    }, _check_hr),
+}
+
+
+class TestRealWorldScenarios:
+    """Test real-world anonymization scenarios."""
+
+    @pytest.mark.parametrize("scenario", list(SCENARIOS))
+    def test_data_scenario(self, request, class_tmp_dir, scenario):
+        """Test anonymization of healthcare, financial and HR data."""
+        config, check = SCENARIOS[scenario]
+        input_path = request.getfixturevalue(f"{scenario}_csv_path")
+        output_path = class_tmp_dir / f"{scenario}_anonymized.csv"
+
         run_anonymization_job(
             str(input_path),
             str(output_path),
             'csv',
             config
         )
-        
-        result = pd.read_csv(output_path)
-        
-        # Verify HR data anonymization
-        assert result['employee_id'].iloc[0] != 'E001'
-        assert result['full_name'].iloc[0] != 'John Doe'
-        assert '@' in result['email'].iloc[0]
-        assert result['phone'].iloc[0] != '555-1234'
-        assert '-' in result['salary'].iloc[0]  # Generalized
-        assert 'Q' in result['hire_date'].iloc[0]  # Quarter format
-        assert result['department'].iloc[0] != 'Engineering' or result['department'].iloc[0] == '[REDACTED]'
+
+        check(_read_csv(output_path))
 
 
 class TestSampleDataGeneration:
     """Test sample data generation integration."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.generator = SampleDataGenerator(str(self.temp_dir))
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_sample_data_generation_and_anonymization(self):
+    def test_sample_data_generation_and_anonymization(self, class_tmp_dir, sample_csv):
         """Test generating sample data and then anonymizing it."""
-        # Generate sample CSV
-        sample_path = self.generator.generate_csv_sample("test_sample.csv", rows=100)
-        
+        sample_path = sample_csv
+
         # Verify sample was created
         assert sample_path.exists()
         
         # Load and verify sample data
-        sample_data = pd.read_csv(sample_path)
+        sample_data = _read_csv(sample_path)
         assert len(sample_data) == 100
         assert 'Name' in sample_data.columns
         assert 'Email' in sample_data.columns
@@ -564,7 +582,7 @@ class TestSampleDataGeneration:
             }
         }
         
-        output_path = self.temp_dir / "anonymized_sample.csv"
+        output_path = class_tmp_dir / "anonymized_sample.csv"
         
         run_anonymization_job(
             str(sample_path),
@@ -574,10 +592,11 @@ class TestSampleDataGeneration:
         )
         
         # Verify anonymized output
-        result = pd.read_csv(output_path)
+        result = _read_csv(output_path)
         assert len(result) == 100
-        assert result['Name'].iloc[0] != sample_data['Name'].iloc[0]
-        assert '@' in result['Email'].iloc[0]
+        first = result.iloc[0]
+        assert first['Name'] != sample_data['Name'].iloc[0]
+        assert '@' in first['Email']
 
 
 if __name__ == "__main__":
@@ -11,34 +11,50 @@ import json
 import secrets
 import string
 
-from src.data_anonymizer.core.anonymizer import DataAnonymizer
+from src.data_anonymizer.core.anonymizer import COMMON_EMAIL_DOMAINS, DataAnonymizer
+
+# Compiled once for the digit checks in the format and leakage tests
+_DIGIT_RE = re.compile(r'\d')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Value-level methods and inputs for the determinism checks
+DETERMINISTIC_METHODS = ["hash_value", "anonymize_email", "anonymize_phone", "anonymize_ssn"]
+DETERMINISTIC_VALUES = ["John Doe", "jane.smith@company.com", "(555) 123-4567", "123-45-6789"]
+
+
+@pytest.fixture(scope="class")
+def anonymizer():
+    """One anonymizer per test class instead of one per test."""
+    return DataAnonymizer()
+
+
+@pytest.fixture(scope="class")
+def salted_anonymizer():
+    """Like anonymizer, but with an explicit salt."""
+    return DataAnonymizer(salt="test_security_salt")
 
 
 class TestSecurityBasics:
     """Test basic security properties of anonymization methods."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer(salt="test_security_salt")
-
-    def test_hash_irreversibility(self):
+    def test_hash_irreversibility(self, salted_anonymizer):
         """Test that hashed values cannot be easily reversed."""
         original_values = ["John Doe", "Jane Smith", "sensitive_data", "123-45-6789"]
         
         for value in original_values:
-            hashed = self.anonymizer.hash_value(value)
+            hashed = salted_anonymizer.hash_value(value)
             
             # Hash should be different from original
             assert hashed != value
             
             # Hash should be consistent
-            assert hashed == self.anonymizer.hash_value(value)
+            assert hashed == salted_anonymizer.hash_value(value)
             
             # Hash should be proper length for SHA256
             assert len(hashed) == 64
             
-            # Hash should only contain hex characters
-            assert all(c in '0123456789abcdef' for c in hashed)
+            # Hash should only contain hex characters (fromhex raises otherwise)
+            assert len(bytes.fromhex(hashed)) == 32
 
     def test_salt_effectiveness(self):
         """Test that salt prevents rainbow table attacks."""
@@ -58,42 +74,44 @@ class TestSecurityBasics:
         assert hash1 != simple_hash
         assert hash2 != simple_hash
 
-    def test_deterministic_anonymization(self):
+    @pytest.mark.parametrize("value", DETERMINISTIC_VALUES)
+    @pytest.mark.parametrize("method_name", DETERMINISTIC_METHODS)
+    def test_deterministic_anonymization(self, salted_anonymizer, method_name, value):
         """Test that anonymization is deterministic for the same input."""
-        test_data = ["John Doe", "jane.smith@company.com", "(555) 123-4567", "123-45-6789"]
+        method = getattr(salted_anonymizer, method_name)
         
-        methods = [
-            ("hash", lambda x: self.anonymizer.hash_value(x)),
-            ("email", lambda x: self.anonymizer.anonymize_email(x)),
-            ("phone", lambda x: self.anonymizer.anonymize_phone(x)),
-            ("ssn", lambda x: self.anonymizer.anonymize_ssn(x))
-        ]
+        result1 = method(value)
+        result2 = method(value)
         
-        for method_name, method_func in methods:
-            for value in test_data:
-                result1 = method_func(value)
-                result2 = method_func(value)
-                
-                assert result1 == result2, f"{method_name} should be deterministic"
+        assert result1 == result2, f"{method_name} should be deterministic"
 
-    def test_collision_resistance(self):
+    def test_collision_resistance(self, salted_anonymizer):
         """Test that different inputs produce different outputs."""
         # Generate many similar values
         values = [f"user_{i}" for i in range(1000)]
         
-        hashes = [self.anonymizer.hash_value(value) for value in values]
+        hashes = salted_anonymizer.hash_values(values)
         
         # All hashes should be unique
-        assert len(set(hashes)) == len(hashes)
+        assert pd.Series(hashes).is_unique
         
         # Test with email anonymization
-        emails = [f"user{i}@company.com" for i in range(100)]
-        anonymized_emails = [self.anonymizer.anonymize_email(email) for email in emails]
+        emails = pd.Series([f"user{i}@company.com" for i in range(100)])
+        anonymized_emails = salted_anonymizer.anonymize_email_series(emails)
         
         # Should maintain uniqueness
-        assert len(set(anonymized_emails)) == len(set(emails))
+        assert anonymized_emails.nunique() == emails.nunique()
 
-    def test_format_preservation_security(self):
+    @pytest.mark.slow
+    def test_collision_resistance_at_scale(self, salted_anonymizer):
+        """Test that 100k similar values still hash without collisions."""
+        values = [f"user_{i}" for i in range(100_000)]
+        
+        hashes = salted_anonymizer.hash_values(values)
+        
+        assert pd.Series(hashes).is_unique
+
+    def test_format_preservation_security(self, salted_anonymizer):
         """Test that format preservation doesn't leak information."""
         # Test phone number format preservation
         phones = [
@@ -102,129 +120,118 @@ class TestSecurityBasics:
             "(555) 555-5555"
         ]
         
-        anonymized_phones = [self.anonymizer.anonymize_phone(phone) for phone in phones]
+        anonymized_phones = [salted_anonymizer.anonymize_phone(phone) for phone in phones]
         
         for original, anonymized in zip(phones, anonymized_phones):
             # Should preserve format
             assert len(original) == len(anonymized)
             
             # Should not contain original digits
-            original_digits = ''.join(re.findall(r'\d', original))
-            anonymized_digits = ''.join(re.findall(r'\d', anonymized))
+            original_digits = _NON_DIGIT_RE.sub('', original)
+            anonymized_digits = _NON_DIGIT_RE.sub('', anonymized)
             assert original_digits != anonymized_digits
             
             # Should preserve non-digit characters
-            original_format = re.sub(r'\d', 'X', original)
-            anonymized_format = re.sub(r'\d', 'X', anonymized)
+            original_format = _DIGIT_RE.sub('X', original)
+            anonymized_format = _DIGIT_RE.sub('X', anonymized)
             assert original_format == anonymized_format
 
-    def test_email_domain_handling(self):
+    def test_email_domain_handling(self, salted_anonymizer):
         """Test secure handling of email domains."""
         # Test with various domain types
-        test_emails = [
+        test_emails = pd.Series([
             "user@company.com",
             "admin@sensitive-corp.org",
             "test@personal-domain.net",
             "user@gmail.com",  # Common domain
             "user@outlook.com"  # Common domain
-        ]
+        ])
         
-        anonymized_emails = [self.anonymizer.anonymize_email(email) for email in test_emails]
+        anonymized_emails = salted_anonymizer.anonymize_email_series(test_emails)
         
-        for original, anonymized in zip(test_emails, anonymized_emails):
-            # Should preserve email format
-            assert "@" in anonymized
-            
-            # Should not leak original username
-            original_username = original.split("@")[0]
-            anonymized_username = anonymized.split("@")[0]
-            assert original_username != anonymized_username
-            
-            # Common domains should be preserved, custom domains should be anonymized
-            original_domain = original.split("@")[1]
-            anonymized_domain = anonymized.split("@")[1]
-            
-            if original_domain in ["gmail.com", "yahoo.com", "outlook.com"]:
-                assert anonymized_domain == original_domain
-            else:
-                assert anonymized_domain != original_domain
+        # Should preserve email format
+        assert anonymized_emails.str.contains("@").all()
+        
+        original = test_emails.str.split("@", n=1, expand=True)
+        anonymized = anonymized_emails.str.split("@", n=1, expand=True)
+        
+        # Should not leak original username
+        assert (original[0] != anonymized[0]).all()
+        
+        # Common domains should be preserved, custom domains should be anonymized
+        common = original[1].isin(COMMON_EMAIL_DOMAINS)
+        assert (original[1][common] == anonymized[1][common]).all()
+        assert (original[1][~common] != anonymized[1][~common]).all()
 
 
 class TestPrivacyPreservation:
     """Test privacy preservation properties."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-
-    def test_k_anonymity_privacy(self):
+    def test_k_anonymity_privacy(self, anonymizer):
         """Test k-anonymity privacy preservation."""
         # Create test data with known frequencies
         data = pd.Series(['A'] * 10 + ['B'] * 5 + ['C'] * 3 + ['D'] * 1)
         
         # Test with k=5
-        result = self.anonymizer.k_anonymity_suppress(data, k=5)
+        result = anonymizer.k_anonymity_suppress(data, k=5)
         
-        # Count occurrences in result
+        # Count occurrences in result once and read everything from the counts
         value_counts = result.value_counts()
         
         # Values with count < k should be suppressed
-        assert value_counts.get('C', 0) == 0 or result[result == 'C'].empty
-        assert value_counts.get('D', 0) == 0 or result[result == 'D'].empty
+        assert value_counts.get('C', 0) == 0
+        assert value_counts.get('D', 0) == 0
         
         # Values with count >= k should remain
         assert value_counts.get('A', 0) == 10
         assert value_counts.get('B', 0) == 5
         
         # Suppressed values should be marked appropriately
-        suppressed_count = (result == '[SUPPRESSED]').sum()
-        assert suppressed_count == 4  # 3 'C's + 1 'D'
+        assert value_counts.get('[SUPPRESSED]', 0) == 4  # 3 'C's + 1 'D'
 
-    def test_differential_privacy_noise(self):
+    def test_differential_privacy_noise(self, anonymizer):
         """Test differential privacy noise addition."""
         base_value = 100
         epsilon = 1.0
         
-        # Generate many noisy values
-        noisy_values = [
-            self.anonymizer.differential_privacy_noise(base_value, epsilon)
-            for _ in range(1000)
-        ]
+        # Generate many noisy values in one batched draw
+        noisy_values = anonymizer.differential_privacy_series(
+            pd.Series(np.full(1000, base_value)), epsilon
+        )
         
         # Check that noise is added (values should vary)
-        assert len(set(noisy_values)) > 1
+        assert noisy_values.nunique() > 1
         
         # Check that values are still numeric
-        assert all(isinstance(v, (int, float)) for v in noisy_values)
+        assert pd.api.types.is_numeric_dtype(noisy_values)
         
         # Check that noise follows expected distribution properties
-        mean_value = sum(noisy_values) / len(noisy_values)
+        mean_value = noisy_values.mean()
         assert abs(mean_value - base_value) < 10  # Should be close to original on average
 
-    def test_generalization_privacy(self):
+    def test_generalization_privacy(self, anonymizer):
         """Test that generalization provides privacy protection."""
         # Test numeric generalization
-        sensitive_ages = [25, 26, 27, 28, 29, 35, 36, 37, 38, 39]
+        sensitive_ages = pd.Series([25, 26, 27, 28, 29, 35, 36, 37, 38, 39])
         
-        generalized_ages = [
-            self.anonymizer.generalize_numeric(age, bin_size=10)
-            for age in sensitive_ages
-        ]
+        generalized_ages = anonymizer.generalize_numeric_series(
+            sensitive_ages, bin_size=10
+        )
         
         # All ages in 20s should be generalized to same bin
-        twenties_generalized = [gen for age, gen in zip(sensitive_ages, generalized_ages) if 20 <= age < 30]
-        assert all(gen == "20-29" for gen in twenties_generalized)
+        twenties = sensitive_ages.between(20, 29)
+        assert (generalized_ages[twenties] == "20-29").all()
         
         # All ages in 30s should be generalized to same bin
-        thirties_generalized = [gen for age, gen in zip(sensitive_ages, generalized_ages) if 30 <= age < 40]
-        assert all(gen == "30-39" for gen in thirties_generalized)
+        thirties = sensitive_ages.between(30, 39)
+        assert (generalized_ages[thirties] == "30-39").all()
 
-    def test_substitution_security(self):
+    def test_substitution_security(self, anonymizer):
         """Test that substitution doesn't leak information."""
         sensitive_values = ["CEO", "CTO", "Manager", "Director"]
         
         substituted_values = [
-            self.anonymizer.substitute_value(value, {"type": "generic"})
+            anonymizer.substitute_value(value, {"type": "generic"})
             for value in sensitive_values
         ]
         
@@ -236,7 +243,7 @@ class TestPrivacyPreservation:
         for substituted in substituted_values:
             assert substituted in ["[REDACTED]"]  # Default when no specific type matches
 
-    def test_perturb_noise_properties(self):
+    def test_perturb_noise_properties(self, anonymizer):
         """Test that perturbation provides appropriate noise."""
         base_salary = 50000
         
@@ -247,48 +254,40 @@ class TestPrivacyPreservation:
             {"type": "percentage", "percentage": 10}
         ]
         
+        salaries = pd.Series(np.full(100, base_salary))
+        
         for config in perturbation_configs:
-            perturbed_values = [
-                self.anonymizer.perturb_value(base_salary, config)
-                for _ in range(100)
-            ]
+            perturbed_values = anonymizer.perturb_series(salaries, config)
             
             # Should have variation
-            assert len(set(perturbed_values)) > 1
+            assert perturbed_values.nunique() > 1
             
             # Should be in reasonable range
-            if config["type"] == "percentage":
-                # 10% of 50000 = 5000
-                assert all(45000 <= v <= 55000 for v in perturbed_values)
-            elif config["type"] == "uniform":
-                # ±5000 range
-                assert all(45000 <= v <= 55000 for v in perturbed_values)
+            if config["type"] in ("percentage", "uniform"):
+                # 10% of 50000 and the ±5000 range both bound values to this
+                assert 45000 <= perturbed_values.min()
+                assert perturbed_values.max() <= 55000
 
 
 class TestDataLeakagePrevention:
     """Test prevention of data leakage through anonymization."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-
-    def test_no_partial_information_leakage(self):
+    def test_no_partial_information_leakage(self, anonymizer):
         """Test that partial information is not leaked."""
         # Test with SSN
         ssn = "123-45-6789"
-        anonymized_ssn = self.anonymizer.anonymize_ssn(ssn)
+        anonymized_ssn = anonymizer.anonymize_ssn(ssn)
         
         # Should not contain any original digits
-        original_digits = ''.join(re.findall(r'\d', ssn))
-        anonymized_digits = ''.join(re.findall(r'\d', anonymized_ssn))
+        original_digits = _NON_DIGIT_RE.sub('', ssn)
+        anonymized_digits = _NON_DIGIT_RE.sub('', anonymized_ssn)
         
-        # No substring of original digits should appear in anonymized
-        for i in range(len(original_digits)):
-            for j in range(i+2, len(original_digits)+1):
-                substring = original_digits[i:j]
-                assert substring not in anonymized_digits
+        # No substring of original digits should appear in anonymized; every
+        # longer substring contains a two-digit one, so one alternation suffices
+        pairs = {original_digits[i:i+2] for i in range(len(original_digits) - 1)}
+        assert re.search("|".join(sorted(pairs)), anonymized_digits) is None
 
-    def test_consistent_anonymization_across_columns(self):
+    def test_consistent_anonymization_across_columns(self, anonymizer):
         """Test that same values are anonymized consistently across columns."""
         df = pd.DataFrame({
             'primary_email': ['john@company.com', 'jane@company.com'],
@@ -304,7 +303,7 @@ class TestDataLeakagePrevention:
             'username': 'hash'
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Same email values should be anonymized consistently
         assert result.loc[0, 'primary_email'] == result.loc[0, 'backup_email']
@@ -314,7 +313,7 @@ class TestDataLeakagePrevention:
         assert result.loc[0, 'user_id'] == result.loc[0, 'username']
         assert result.loc[1, 'user_id'] == result.loc[1, 'username']
 
-    def test_prevent_inference_attacks(self):
+    def test_prevent_inference_attacks(self, anonymizer):
         """Test protection against inference attacks."""
         # Create data where inference might be possible
         df = pd.DataFrame({
@@ -329,7 +328,7 @@ class TestDataLeakagePrevention:
             'department': 'hash'
         }
         
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = anonymizer.anonymize_dataframe(df, config)
         
         # Age should be generalized to prevent precise inference
         assert all(result['age'] == "25-29")
@@ -337,28 +336,17 @@ class TestDataLeakagePrevention:
         # Department should be consistently anonymized
         assert len(result['department'].unique()) == 1
 
-    def test_temporal_pattern_protection(self):
+    def test_temporal_pattern_protection(self, anonymizer):
         """Test protection against temporal pattern analysis."""
-        dates = [
+        dates = pd.Series([
             '2023-01-15', '2023-02-20', '2023-03-10',
             '2023-04-05', '2023-05-12', '2023-06-18'
-        ]
+        ])
         
         # Test different granularities
-        month_generalized = [
-            self.anonymizer.generalize_date(date, "month")
-            for date in dates
-        ]
-        
-        quarter_generalized = [
-            self.anonymizer.generalize_date(date, "quarter")
-            for date in dates
-        ]
-        
-        year_generalized = [
-            self.anonymizer.generalize_date(date, "year")
-            for date in dates
-        ]
+        month_generalized = anonymizer.generalize_date_series(dates, "month")
+        quarter_generalized = anonymizer.generalize_date_series(dates, "quarter")
+        year_generalized = anonymizer.generalize_date_series(dates, "year")
         
         # Month level should group by month
         assert month_generalized[0] == "2023-01"
@@ -371,35 +359,47 @@ class TestDataLeakagePrevention:
         assert quarter_generalized[3] == "2023-Q2"
         
         # Year level should group all by year
-        assert all(gen == "2023" for gen in year_generalized)
+        assert (year_generalized == "2023").all()
 
 
 class TestCryptographicSecurity:
     """Test cryptographic security properties."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-
-    def test_secure_random_usage(self):
+    def test_secure_random_usage(self, anonymizer):
         """Test that cryptographically secure random is used."""
         # Test shuffle function
         data = pd.Series(range(100))
         
-        # Multiple shuffles should produce different results
-        shuffle_results = [
-            self.anonymizer.shuffle_column(data).tolist()
-            for _ in range(10)
-        ]
+        # Two shuffles already rule out a deterministic order; equal
+        # permutations of 100 values occur with probability 1/100!
+        shuffle_results = anonymizer.shuffle_column(data, n_shuffles=2)
         
         # Should have variation between shuffles
-        assert len(set(tuple(result) for result in shuffle_results)) > 1
+        assert np.unique(shuffle_results, axis=0).shape[0] > 1
         
         # Each shuffle should contain all original values
-        for result in shuffle_results:
-            assert set(result) == set(data)
-
-    def test_hash_algorithm_security(self):
+        expected = np.broadcast_to(np.arange(100), shuffle_results.shape)
+        assert np.array_equal(np.sort(shuffle_results, axis=1), expected)
+
+    @pytest.mark.slow
+    def test_shuffle_position_uniformity(self, anonymizer):
+        """Test that every value is equally likely to land in every position."""
+        size, n_shuffles = 100, 1000
+        data = pd.Series(range(size))
+        
+        counts = np.zeros((size, size), dtype=np.int64)
+        positions = np.arange(size)
+        for _ in range(n_shuffles):
+            counts[anonymizer.shuffle_column(data).to_numpy(), positions] += 1
+        
+        # Chi-square over the value/position table; without scipy, compare
+        # against the statistic's mean plus six standard deviations
+        expected = n_shuffles / size
+        chi2 = ((counts - expected) ** 2 / expected).sum()
+        dof = (size - 1) ** 2
+        assert chi2 < dof + 6 * np.sqrt(2 * dof)
+
+    def test_hash_algorithm_security(self, anonymizer):
         """Test security of hash algorithms."""
         value = "test_value"
         
@@ -408,14 +408,14 @@ class TestCryptographicSecurity:
         
         for algorithm in algorithms:
             try:
-                result = self.anonymizer.hash_value(value, algorithm)
+                result = anonymizer.hash_value(value, algorithm)
                 
                 # Should be proper length
                 expected_lengths = {"sha256": 64, "sha512": 128, "md5": 32}
                 assert len(result) == expected_lengths[algorithm]
                 
                 # Should be hex string
-                assert all(c in '0123456789abcdef' for c in result)
+                assert len(bytes.fromhex(result)) == expected_lengths[algorithm] // 2
                 
                 # Should be different from plain value
                 assert result != value
@@ -424,52 +424,75 @@ class TestCryptographicSecurity:
                 # Some algorithms might not be supported
                 pass
 
-    def test_noise_generation_security(self):
+    def test_noise_generation_security(self, anonymizer, os_entropy):
         """Test that noise generation is cryptographically secure."""
         base_value = 1000
         
-        # Generate many noise values
-        noise_values = []
-        for _ in range(1000):
-            config = {"type": "uniform", "range": 100}
-            noisy_value = self.anonymizer.perturb_value(base_value, config)
-            noise_values.append(noisy_value - base_value)
+        # Generate many noise values in one batched draw
+        config = {"type": "uniform", "range": 100}
+        noisy_values = anonymizer.perturb_series(
+            pd.Series(np.full(1000, base_value)), config
+        )
+        noise_values = noisy_values - base_value
+        
+        # The noise should come from the OS CSPRNG, not a seeded generator
+        assert os_entropy
         
         # Noise should be well-distributed
-        assert len(set(noise_values)) > 100  # Should have good variation
+        assert noise_values.nunique() > 100  # Should have good variation
         
         # Should be within expected range
-        assert all(-100 <= noise <= 100 for noise in noise_values)
+        assert noise_values.between(-100, 100).all()
         
         # Should not show obvious patterns
         # (This is a basic test - more sophisticated analysis would be needed for full validation)
-        mean_noise = sum(noise_values) / len(noise_values)
+        mean_noise = noise_values.mean()
         assert abs(mean_noise) < 10  # Should be roughly centered around 0
 
 
+@pytest.fixture(scope="class")
+def compliance_result(anonymizer):
+    """GDPR, HIPAA and PCI style columns anonymized together in one pass."""
+    df = pd.DataFrame({
+        # GDPR: right to erasure and pseudonymization
+        'name': ['John Doe', 'Jane Smith'],
+        'personal_id': ['ID001', 'ID002'],
+        'public_info': ['Engineer', 'Manager'],
+        # HIPAA: healthcare-like data
+        'patient_id': ['P001', 'P002'],
+        'date_of_birth': ['1990-01-15', '1985-05-20'],
+        'diagnosis': ['Diabetes', 'Hypertension'],
+        'zip_code': ['12345', '67890'],
+        # PCI: payment card data
+        'card_number': ['1234-5678-9012-3456', '2345-6789-0123-4567'],
+        'cvv': ['123', '456'],
+        'expiry': ['12/25', '03/26'],
+        'amount': [100.50, 250.75]
+    })
+    
+    config = {
+        'personal_id': 'remove',  # Right to erasure
+        'name': 'hash',  # Pseudonymization
+        'public_info': 'hash',  # Ensure no direct identification
+        'patient_id': 'hash',
+        'date_of_birth': {'method': 'generalize_date', 'options': {'granularity': 'year'}},
+        'diagnosis': 'hash',
+        'zip_code': {'method': 'generalize_numeric', 'options': {'bin_size': 1000}},
+        'card_number': 'hash',  # Should be completely anonymized
+        'cvv': 'remove',  # Should be removed for PCI compliance
+        'expiry': 'hash',  # Should be anonymized
+        'amount': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 5}}
+    }
+    
+    return anonymizer.anonymize_dataframe(df, config)
+
+
 class TestComplianceAndStandards:
     """Test compliance with privacy standards and regulations."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.anonymizer = DataAnonymizer()
-
-    def test_gdpr_compliance_features(self):
+    def test_gdpr_compliance_features(self, compliance_result):
         """Test features that support GDPR compliance."""
-        # Test right to erasure (column removal)
-        df = pd.DataFrame({
-            'name': ['John Doe', 'Jane Smith'],
-            'personal_id': ['ID001', 'ID002'],
-            'public_info': ['Engineer', 'Manager']
-        })
-        
-        config = {
-            'personal_id': 'remove',  # Right to erasure
-            'name': 'hash',  # Pseudonymization
-            'public_info': 'hash'  # Ensure no direct identification
-        }
-        
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = compliance_result
         
         # Personal ID should be removed
         assert 'personal_id' not in result.columns
@@ -478,24 +501,9 @@ class TestComplianceAndStandards:
         assert result['name'].iloc[0] != 'John Doe'
         assert result['name'].iloc[1] != 'Jane Smith'
 
-    def test_hipaa_compliance_features(self):
+    def test_hipaa_compliance_features(self, compliance_result):
         """Test features that support HIPAA compliance."""
-        # Test with healthcare-like data
-        df = pd.DataFrame({
-            'patient_id': ['P001', 'P002'],
-            'date_of_birth': ['1990-01-15', '1985-05-20'],
-            'diagnosis': ['Diabetes', 'Hypertension'],
-            'zip_code': ['12345', '67890']
-        })
-        
-        config = {
-            'patient_id': 'hash',
-            'date_of_birth': {'method': 'generalize_date', 'options': {'granularity': 'year'}},
-            'diagnosis': 'hash',
-            'zip_code': {'method': 'generalize_numeric', 'options': {'bin_size': 1000}}
-        }
-        
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = compliance_result
         
         # Patient ID should be hashed
         assert result['patient_id'].iloc[0] != 'P001'
@@ -511,24 +519,9 @@ class TestComplianceAndStandards:
         zip_result = result['zip_code'].iloc[0]
         assert len(zip_result) == 5 or '-' in zip_result  # Accept both formats
 
-    def test_pci_compliance_features(self):
+    def test_pci_compliance_features(self, compliance_result):
         """Test features that support PCI compliance."""
-        # Test with payment card data
-        df = pd.DataFrame({
-            'card_number': ['1234-5678-9012-3456', '2345-6789-0123-4567'],
-            'cvv': ['123', '456'],
-            'expiry': ['12/25', '03/26'],
-            'amount': [100.50, 250.75]
-        })
-        
-        config = {
-            'card_number': 'hash',  # Should be completely anonymized
-            'cvv': 'remove',  # Should be removed for PCI compliance
-            'expiry': 'hash',  # Should be anonymized
-            'amount': {'method': 'perturb', 'options': {'type': 'percentage', 'percentage': 5}}
-        }
-        
-        result = self.anonymizer.anonymize_dataframe(df, config)
+        result = compliance_result
         
         # Card number should be hashed
         assert result['card_number'].iloc[0] != '1234-5678-9012-3456'